@@ -13,13 +13,16 @@ setup(
         "selenium>=4.1.0",
         "beautifulsoup4>=4.10.0",
         "html2text>=2020.1.16",
+        "lxml>=4.6.0",
         "webdriver-manager>=3.5.2",
     ],
     extras_require={
         "full": [
             "selenium-stealth>=1.0.6",
             "undetected-chromedriver>=3.4.6",
-            "playwright>=1.51.0"
+            "playwright>=1.51.0",
+            "orjson>=3.6.0",
+            "pyahocorasick>=2.0.0",
         ],
     },
     entry_points={
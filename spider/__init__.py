@@ -8,9 +8,19 @@ searching websites for keywords or saving content as markdown.
 __version__ = "1.1.8"
 __author__ = "Michael Elliott"
 
-from .content.filter import ContentFilter
-from .core.checkpoint import CheckpointManager
-from .core.crawler import Spider
-from .core.rate_controller import CrawlRateController
+from ._lazy import lazy_exports
+
+# Exported name -> submodule that defines it. These are imported on first
+# access (PEP 562), so running the CLI (e.g. for --help) does not load the
+# crawler and its browser dependencies up front.
+_LAZY_ATTRS = {
+    "Spider": ".core.crawler",
+    "CrawlRateController": ".core.rate_controller",
+    "CheckpointManager": ".core.checkpoint",
+    "ContentFilter": ".content.filter",
+}
 
 __all__ = ["Spider", "CrawlRateController", "CheckpointManager", "ContentFilter"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS, __all__)
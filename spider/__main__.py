@@ -14,8 +14,6 @@ from multiprocessing import freeze_support
 
 from .cli.argument_parser import parse_args, print_config_summary
 from .cli.config import load_config_from_args, save_config
-from .content.filter import ContentFilter
-from .core.crawler import Spider
 
 
 def main():
@@ -89,6 +87,11 @@ def main():
         # Print configuration summary
         print_config_summary(args)
 
+        # Import the crawler only once a crawl is actually starting, since it
+        # pulls in the browser and HTML parsing dependencies
+        from .content.filter import ContentFilter
+        from .core.crawler import Spider
+
         # Create content filter
         content_filter = ContentFilter(
             include_headers=config.include_headers,
@@ -280,14 +283,6 @@ def main():
                             if hasattr(thread, "stop_event"):
                                 thread.stop_event.set()
                     
-                    # Clear any multiprocessing resources
-                    if hasattr(spider, 'manager'):
-                        try:
-                            print("Shutting down multiprocessing manager...")
-                            spider.manager.shutdown()
-                        except:
-                            pass
-                    
                     # Clear task and result queues
                     try:
                         while not spider.task_queue.empty():
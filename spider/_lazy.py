@@ -0,0 +1,39 @@
+"""
+Lazy attribute loading for packages (PEP 562).
+
+Packages that re-export names from heavy submodules use this so the
+submodule is only imported when one of its names is first accessed.
+"""
+
+import importlib
+
+
+def lazy_exports(package_name, package_globals, lazy_attrs, all_names):
+    """
+    Build the module-level __getattr__ and __dir__ hooks for a package.
+
+    Args:
+        package_name: The package's __name__, used to resolve relative imports
+        package_globals: The package's globals(); loaded names are stored here
+            so later lookups do not go through __getattr__ again
+        lazy_attrs: Dict mapping each exported name to the relative submodule
+            that defines it
+        all_names: The package's __all__
+
+    Returns:
+        tuple: (__getattr__, __dir__) functions to assign in the package
+    """
+
+    def __getattr__(name):
+        submodule = lazy_attrs.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(submodule, package_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(all_names))
+
+    return __getattr__, __dir__
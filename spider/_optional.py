@@ -0,0 +1,31 @@
+"""
+Loading of optional dependencies.
+
+Speed-ups such as pyahocorasick are not required; code that can use them
+asks for the module here and falls back to a pure-Python path when it is
+missing.
+"""
+
+# pyahocorasick module, once an import has been attempted
+_ahocorasick = None
+_ahocorasick_import_attempted = False
+
+
+def load_ahocorasick():
+    """
+    Import pyahocorasick on first use and memoize the result.
+
+    Returns:
+        module: The ahocorasick module, or None if it is not installed
+    """
+    global _ahocorasick, _ahocorasick_import_attempted
+
+    if not _ahocorasick_import_attempted:
+        _ahocorasick_import_attempted = True
+        try:
+            import ahocorasick
+
+            _ahocorasick = ahocorasick
+        except ImportError:
+            pass
+    return _ahocorasick
@@ -6,7 +6,7 @@ and navigating web pages including SPAs (Single Page Applications).
 """
 
 from .common.interface import Browser, BrowserFactory, BrowserNavigator
-from .utils import execute_browser_script, clean_cookie_elements
+from .utils import execute_browser_script, clean_cookie_elements, install_cookie_cleaner
 
 # Export the factory function for creating browser instances
 create_browser = BrowserFactory.create
@@ -25,4 +25,5 @@ __all__ = [
     "hash_page_content",   # Utility to hash page content
     "execute_browser_script", # Utility to execute evals correctly in either Playwright or Selenium
     "clean_cookie_elements", # Utility to handle pesky cookie banners and pref centres
+    "install_cookie_cleaner", # Utility to remove cookie banners automatically on every page
 ]
\ No newline at end of file
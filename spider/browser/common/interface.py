@@ -93,6 +93,7 @@ class BrowserFactory:
         headless: bool = True,
         webdriver_path: Optional[str] = None,
         type: str = "chromium",
+        user_data_dir: Optional[str] = None,
         **kwargs: Any
     ) -> Browser:
         """
@@ -103,6 +104,7 @@ class BrowserFactory:
             headless: Whether to run in headless mode
             webdriver_path: Path to the WebDriver executable (for Selenium)
             type: Browser type to use ('chromium', 'chrome', 'webkit', 'firefox')
+            user_data_dir: Persistent profile directory (for Selenium)
             **kwargs: Additional engine-specific options
             
         Returns:
@@ -113,7 +115,12 @@ class BrowserFactory:
             return setup_playwright_browser(headless=headless, browser_type=type, **kwargs)
         else:
             from ..selenium.driver import setup_webdriver
-            return setup_webdriver(headless=headless, webdriver_path=webdriver_path, **kwargs)
+            return setup_webdriver(
+                headless=headless,
+                webdriver_path=webdriver_path,
+                user_data_dir=user_data_dir,
+                **kwargs
+            )
 
 
 class BrowserNavigator:
@@ -6,6 +6,7 @@ This module contains functions for creating and configuring WebDriver instances
 with appropriate settings for web crawling.
 """
 
+import os
 import random
 import time
 import types
@@ -17,6 +18,39 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Static Chrome flags shared by every browser launch. Kept as a module-level
+# tuple so restarts don't rebuild the same argument strings each time.
+CHROME_ARGUMENTS = (
+    # Essential options for performance
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    # Additional performance optimizations
+    "--disable-notifications",
+    "--disable-popup-blocking",
+    "--disable-background-networking",
+    "--disable-backgrounding-occluded-windows",
+)
+
+# Path of the chromedriver binary resolved by webdriver-manager, cached so
+# browser restarts in the same process don't repeat the lookup
+_chromedriver_path = None
+
+
+def get_chromedriver_path():
+    """
+    Resolve the chromedriver binary once per process and reuse it.
+
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    global _chromedriver_path
+
+    if _chromedriver_path is None or not os.path.exists(_chromedriver_path):
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
 
 def get_random_user_agent():
     """
@@ -53,7 +87,11 @@ def get_random_user_agent():
 
 
 def setup_webdriver(
-    headless=True, webdriver_path=None, retry_count=3, page_load_timeout=30
+    headless=True,
+    webdriver_path=None,
+    retry_count=3,
+    page_load_timeout=30,
+    user_data_dir=None,
 ):
     """
     Set up and return a Selenium WebDriver instance with retry logic and HTTP status monitoring.
@@ -63,6 +101,8 @@ def setup_webdriver(
         webdriver_path: Path to the WebDriver executable
         retry_count: Number of times to retry WebDriver creation
         page_load_timeout: Timeout for page loads in seconds
+        user_data_dir: Persistent Chrome profile directory; reusing it keeps
+            the HTTP cache and cookies warm across browser restarts
 
     Returns:
         WebDriver: Configured Selenium WebDriver instance
@@ -77,17 +117,13 @@ def setup_webdriver(
     # Optimize page load strategy
     chrome_options.page_load_strategy = "normal"  # Use 'eager' if not handling SPAs
 
-    # Essential options for performance - keep existing ones
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
+    # Static performance flags
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
 
-    # Add new performance optimizations
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-popup-blocking")
-    chrome_options.add_argument("--disable-background-networking")
-    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    # Reuse a persistent profile so restarts start with a warm cache
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
 
     # Add a random user-agent - keep your existing function
     chrome_options.add_argument(f"--user-agent={get_random_user_agent()}")
@@ -102,7 +138,7 @@ def setup_webdriver(
         try:
             # Create driver using Service object with ChromeDriverManager
             if not webdriver_path:
-                service = Service(ChromeDriverManager().install())
+                service = Service(get_chromedriver_path())
             else:
                 service = Service(webdriver_path)
 
@@ -150,11 +186,14 @@ def setup_webdriver(
 
         except (WebDriverException, SessionNotCreatedException) as e:
             print(f"WebDriver creation failed (attempt {attempt+1}/{retry_count}): {e}")
-            time.sleep(2)
 
             if attempt == retry_count - 1:
                 raise
 
+            # Exponential backoff with jitter so workers restarting at the
+            # same time don't retry in lockstep
+            time.sleep(min(30.0, 0.5 * (2 ** attempt)) * (0.5 + random.random()))
+
     raise RuntimeError("Failed to create WebDriver after multiple attempts")
 
 
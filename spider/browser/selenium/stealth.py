@@ -3,13 +3,36 @@
 Browser stealth configuration to avoid bot detection.
 """
 
-try:
-    from selenium_stealth import stealth
-except ImportError:
-    print(
-        "selenium-stealth not installed. For stealth mode, install with: pip install selenium-stealth"
-    )
-    stealth = None
+import logging
+
+logger = logging.getLogger(__name__)
+
+# selenium-stealth is imported on first use rather than at module load, and
+# the outcome is remembered so a missing package is only looked up once
+_stealth = None
+_stealth_import_attempted = False
+
+
+def _load_stealth():
+    """
+    Import selenium-stealth on first use and memoize the result.
+
+    Returns:
+        callable: The selenium_stealth.stealth function, or None if unavailable
+    """
+    global _stealth, _stealth_import_attempted
+
+    if not _stealth_import_attempted:
+        _stealth_import_attempted = True
+        try:
+            from selenium_stealth import stealth
+
+            _stealth = stealth
+        except ImportError:
+            logger.warning(
+                "selenium-stealth not installed. For stealth mode, install with: pip install selenium-stealth"
+            )
+    return _stealth
 
 
 def apply_stealth_mode(driver):
@@ -22,8 +45,9 @@ def apply_stealth_mode(driver):
     Returns:
         WebDriver: The modified WebDriver instance
     """
+    stealth = _load_stealth()
     if stealth is None:
-        print("Warning: selenium-stealth not available, stealth mode not applied")
+        logger.warning("selenium-stealth not available, stealth mode not applied")
         return driver
 
     try:
@@ -36,8 +60,8 @@ def apply_stealth_mode(driver):
             renderer="Intel Iris OpenGL Engine",
             fix_hairline=True,
         )
-        print("Applied stealth mode to WebDriver")
+        logger.debug("Applied stealth mode to WebDriver")
         return driver
     except Exception as e:
-        print(f"Warning: Could not apply stealth mode: {e}")
+        logger.warning("Could not apply stealth mode: %s", e)
         return driver
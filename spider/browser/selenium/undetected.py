@@ -3,14 +3,86 @@
 Undetected ChromeDriver setup for avoiding advanced bot detection.
 """
 
+import logging
+import os
+import random
+import time
 
-def setup_undetected_webdriver(headless=True, retry_count=3):
+logger = logging.getLogger(__name__)
+
+# Standard Chrome flags applied to every launch. undetected-chromedriver
+# refuses to reuse a ChromeOptions object, so only the argument list is shared.
+UC_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+)
+
+# undetected_chromedriver module, imported on first browser creation
+_uc = None
+
+# Path of the patched chromedriver binary, shared by every browser created in
+# this process so undetected-chromedriver doesn't re-patch it on each launch
+_patched_driver_path = None
+
+
+def _import_undetected_chromedriver():
+    """
+    Import undetected-chromedriver on first use and cache the module.
+
+    Returns:
+        module: The undetected_chromedriver module
+
+    Raises:
+        ImportError: If undetected-chromedriver is not installed
+    """
+    global _uc
+
+    if _uc is None:
+        try:
+            import undetected_chromedriver as uc
+        except ImportError:
+            raise ImportError(
+                "undetected-chromedriver not installed. Install with: pip install undetected-chromedriver"
+            )
+        _uc = uc
+    return _uc
+
+
+def _get_patched_driver_path(uc):
+    """
+    Patch the chromedriver binary once and return its cached path.
+
+    Args:
+        uc: The imported undetected_chromedriver module
+
+    Returns:
+        str: Path to the patched chromedriver, or None if patching failed
+            (undetected-chromedriver will then patch on its own)
+    """
+    global _patched_driver_path
+
+    if _patched_driver_path is None or not os.path.exists(_patched_driver_path):
+        try:
+            patcher = uc.Patcher()
+            patcher.auto()
+            _patched_driver_path = patcher.executable_path
+        except Exception as e:
+            logger.warning(
+                "Could not pre-patch chromedriver, falling back to per-launch patching: %s", e
+            )
+            _patched_driver_path = None
+    return _patched_driver_path
+
+
+def setup_undetected_webdriver(headless=True, retry_count=3, user_data_dir=None):
     """
     Set up and return an Undetected ChromeDriver instance.
 
     Args:
         headless: Whether to run in headless mode
         retry_count: Number of times to retry WebDriver creation
+        user_data_dir: Persistent Chrome profile directory to reuse between runs
 
     Returns:
         WebDriver: Configured Undetected ChromeDriver instance
@@ -18,14 +90,7 @@ def setup_undetected_webdriver(headless=True, retry_count=3):
     Raises:
         RuntimeError: If WebDriver creation fails after specified retry attempts
     """
-    try:
-        import undetected_chromedriver as uc
-    except ImportError:
-        raise ImportError(
-            "undetected-chromedriver not installed. Install with: pip install undetected-chromedriver"
-        )
-
-    import time
+    uc = _import_undetected_chromedriver()
 
     for attempt in range(retry_count):
         try:
@@ -35,29 +100,39 @@ def setup_undetected_webdriver(headless=True, retry_count=3):
                 options.add_argument("--headless=new")
 
             # Standard options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
+            for argument in UC_ARGUMENTS:
+                options.add_argument(argument)
+            if user_data_dir:
+                options.add_argument(f"--user-data-dir={user_data_dir}")
 
-            # Create driver
-            driver = uc.Chrome(options=options)
+            # Create driver, reusing the already patched binary when available
+            driver_path = _get_patched_driver_path(uc)
+            if driver_path:
+                driver = uc.Chrome(options=options, driver_executable_path=driver_path)
+            else:
+                driver = uc.Chrome(options=options)
 
             # Set timeouts
             driver.set_page_load_timeout(30)
             driver.set_script_timeout(30)
 
-            print(f"Created undetected ChromeDriver (headless={headless})")
+            logger.debug("Created undetected ChromeDriver (headless=%s)", headless)
             return driver
 
         except Exception as e:
-            print(
-                f"Undetected ChromeDriver creation failed (attempt {attempt+1}/{retry_count}): {e}"
+            logger.warning(
+                "Undetected ChromeDriver creation failed (attempt %d/%d): %s",
+                attempt + 1,
+                retry_count,
+                e,
             )
-            time.sleep(2)
-
             if attempt == retry_count - 1:
                 raise
 
+            # Exponential backoff with jitter so workers restarting at the
+            # same time don't retry in lockstep
+            time.sleep(min(30.0, 0.5 * (2 ** attempt)) * (0.5 + random.random()))
+
     raise RuntimeError(
         "Failed to create Undetected ChromeDriver after multiple attempts"
     )
@@ -1,416 +1,504 @@
+import json
+import logging
 import time
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Selectors for elements that usually mark a cookie consent banner's accept button
+BANNER_SELECTORS = (
+    "[id*='accept']", "[class*='accept']",
+    "[id*='cookie'] button", "[class*='cookie'] button",
+)
+
+# Keywords that indicate cookie preference centers when found in an id or class
+PREF_KEYWORDS = (
+    'cookieyes', 'cookie-preferences', 'cookie-settings',
+    'cookie-choices', 'consent-preferences', 'consent-manager',
+    'privacy-manager', 'privacy-preferences', 'gdpr-preferences',
+    'cookieconsent', 'cookie-law', 'cookie-control',
+    'cookie-compliance', 'cookie-policy', 'cookie-notice',
+    'privacy-center', 'consent-options', 'cookie-details',
+)
+
+# The scripts below are written once as arrow functions. Playwright's evaluate
+# calls a function source directly; Selenium gets the same source wrapped in an
+# immediately-invoked `return (...)();`. Both forms are built at import time.
+# Selector and keyword lists are filled in from the constants above through
+# json.dumps, so they always end up as valid JS literals.
+
+# Truthy once the page has loaded and a banner is present
+_BANNER_PROBE_TEMPLATE = (
+    "() => document.readyState === 'complete' && "
+    "document.querySelector(__BANNER_SELECTOR__) !== null"
+)
+
+# Find a visible cookie accept button and remove the banner around it
+_BANNER_TEMPLATE = """
+() => {
+    // Common button selectors that indicate cookie banners,
+    // joined so the DOM is only walked once
+    let button = null;
+    const elements = document.querySelectorAll(__BANNER_SELECTOR__);
+    for (const element of elements) {
+        if (element.offsetParent !== null) {
+            button = element;
+            break;
+        }
+    }
+
+    // Otherwise look for a button-like element labelled exactly like a
+    // consent action; textContent avoids forcing a layout for every label
+    if (!button) {
+        const labelPattern = /^(accept( all)?|i accept|ok|agree|got it)$/;
+        for (const element of document.querySelectorAll('button, [role="button"], a[href="#"]')) {
+            const label = (element.textContent || '').trim().toLowerCase();
+            if (labelPattern.test(label) && element.offsetParent !== null) {
+                button = element;
+                break;
+            }
+        }
+    }
+
+    if (!button) return false;
+
+    // Remove the top-level container (direct child of body)
+    let container = button.closest('body > *');
+    if (container) {
+        container.remove();
+        return true;
+    }
+
+    // Fallback: remove the nearest fixed/absolute positioned ancestor. An
+    // inline style is found without touching computed styles; otherwise only
+    // a few levels are checked, since each getComputedStyle can force a style
+    // recalculation.
+    let positioned = button.closest(
+        '[style*="position:fixed"], [style*="position: fixed"], ' +
+        '[style*="position:absolute"], [style*="position: absolute"]'
+    );
+    if (!positioned) {
+        container = button;
+        for (let depth = 0; depth < 5 && container.parentElement; depth++) {
+            const position = window.getComputedStyle(container).position;
+            if (position === 'fixed' || position === 'absolute') {
+                positioned = container;
+                break;
+            }
+            container = container.parentElement;
+        }
+    }
+
+    if (positioned) {
+        positioned.remove();
+        return true;
+    }
+
+    return false;
+}
+"""
+
+# Find a cookie preference center (often hidden) and remove it
+_PREF_TEMPLATE = """
+() => {
+    // Keywords that indicate cookie preference centers
+    const preferenceKeywords = __PREF_KEYWORDS__;
+
+    // Common cookie preference center containers, split by ids and classes
+    // so they can use the fast lookups instead of selector matching
+    const commonIds = [
+        'cookieYes', 'cookieChoices', 'gdprContainer', 'cookieConsent',
+        'cookiePreferences', 'cookieSettings', 'consentManager', 'cookieControl'
+    ];
+    const commonClasses = [
+        'cookieyes', 'cookie-preferences', 'gdpr-container', 'cookie-consent',
+        'cookie-preference', 'cookie-settings', 'consent-manager', 'cookie-control'
+    ];
+
+    // Remove the top-level container (direct child of body) of an element.
+    // Elements are only tried once, however many selectors matched them.
+    const tried = new Set();
+    const removeTopLevelContainer = (element) => {
+        if (tried.has(element)) return false;
+        tried.add(element);
+        const container = element.closest('body > *');
+        if (container) {
+            container.remove();
+            return true;
+        }
+        return false;
+    };
+
+    // Common containers first: id and class lookups are much cheaper than
+    // compiling and matching a selector
+    for (const id of commonIds) {
+        const element = document.getElementById(id);
+        if (element && removeTopLevelContainer(element)) return true;
+    }
+    for (const className of commonClasses) {
+        // Copy the live collection, since removals would shift it
+        for (const element of Array.from(document.getElementsByClassName(className))) {
+            if (removeTopLevelContainer(element)) return true;
+        }
+    }
+
+    // Elements with a keyword in their id or class, fetched with one joined
+    // query instead of one per keyword
+    const joinedSelector = preferenceKeywords
+        .flatMap(keyword => [`[id*="${keyword}"]`, `[class*="${keyword}"]`])
+        .join(', ');
+    for (const element of document.querySelectorAll(joinedSelector)) {
+        if (removeTopLevelContainer(element)) return true;
+    }
+
+    // Check cookie/privacy-flavoured elements for preference wording. Only
+    // elements whose id or class already hints at consent are read, and
+    // textContent is used because innerText forces a layout per element.
+    const candidates = document.querySelectorAll(
+        '[id*="cookie" i], [class*="cookie" i], [id*="consent" i], [class*="consent" i], ' +
+        '[id*="gdpr" i], [class*="gdpr" i], [id*="privacy" i], [class*="privacy" i]'
+    );
+    for (const candidate of candidates) {
+        const text = (candidate.textContent || '').toLowerCase();
+        if ((text.includes('preference') || text.includes('settings') ||
+             text.includes('choices') || text.includes('options')) &&
+            removeTopLevelContainer(candidate)) {
+            return true;
+        }
+    }
+
+    // Fallback: look specifically for cookie preference modals/dialogs
+    const modalSelectors = [
+        'div[role="dialog"]', '.modal', '.dialog', '#cookie-modal',
+        '.cookie-modal', '.consent-modal', '#gdpr-modal'
+    ];
+
+    for (const selector of modalSelectors) {
+        const elements = document.querySelectorAll(selector);
+        for (const el of elements) {
+            const text = (el.textContent || '').toLowerCase();
+            if (text.includes('cookie') || text.includes('privacy') ||
+                text.includes('gdpr') || text.includes('consent')) {
+                el.remove();
+                return true;
+            }
+        }
+    }
+
+    return false;
+}
+"""
+
+
+def _build_banner_js(selectors, template=_BANNER_TEMPLATE):
+    """Fill a banner script template with the given accept-button selectors."""
+    return template.replace('__BANNER_SELECTOR__', json.dumps(', '.join(selectors)))
+
+
+def _build_pref_js(keywords):
+    """Fill the preference-center script template with the given keywords."""
+    return _PREF_TEMPLATE.replace('__PREF_KEYWORDS__', json.dumps(list(keywords)))
+
+
+_BANNER_PROBE_JS = _build_banner_js(BANNER_SELECTORS, _BANNER_PROBE_TEMPLATE)
+_BANNER_JS = _build_banner_js(BANNER_SELECTORS)
+_PREF_JS = _build_pref_js(PREF_KEYWORDS)
+
+# Both cleanups in one script, so a page needs a single round trip.
+# Returns [bannerRemoved, preferenceCenterRemoved]. Once something has been
+# removed the document is flagged, on window and as an attribute on the root
+# element, and later calls on it return immediately; a navigation gets a
+# fresh window and document, which clears both.
+_CLEAN_ALL_JS = (
+    "() => {\n"
+    "    const root = document.documentElement;\n"
+    "    if (window.__spider_cookie_cleaned || root.hasAttribute('data-spider-cleaned')) {\n"
+    "        return [false, false];\n"
+    "    }\n"
+    "    const result = [(" + _BANNER_JS.strip() + ")(), (" + _PREF_JS.strip() + ")()];\n"
+    "    if (result[0] || result[1]) {\n"
+    "        window.__spider_cookie_cleaned = true;\n"
+    "        root.setAttribute('data-spider-cleaned', '1');\n"
+    "    }\n"
+    "    return result;\n"
+    "}"
+)
+
+# Truthy if the fused cleanup has already removed something from this document
+_CLEANED_PROBE_JS = "() => document.documentElement.hasAttribute('data-spider-cleaned')"
+
+# Installed to run before any page script on every new document. It exposes
+# the fused cleanup as window.__spiderClean and reruns it as the DOM changes
+# (debounced), so banners are removed as they appear, without a round trip
+# from Python. The observer disconnects once something has been removed.
+_INIT_JS = (
+    "(() => {\n"
+    "    window.__spiderClean = " + _CLEAN_ALL_JS + ";\n"
+    "    let pending = null;\n"
+    "    const observer = new MutationObserver(() => {\n"
+    "        if (pending !== null) return;\n"
+    "        pending = setTimeout(() => {\n"
+    "            pending = null;\n"
+    "            if (!document.body) return;\n"
+    "            window.__spiderClean();\n"
+    "            if (window.__spider_cookie_cleaned) observer.disconnect();\n"
+    "        }, 50);\n"
+    "    });\n"
+    "    observer.observe(document, {childList: true, subtree: true});\n"
+    "})();"
+)
+
+# Calls the copy of the cleanup already compiled into the page by _INIT_JS, so
+# only this short expression is sent and parsed per page. Returns null when
+# the init script is not present on the current document.
+_CALL_INSTALLED_JS = "() => window.__spiderClean ? window.__spiderClean() : null"
+
+
+def _as_selenium_script(function_source):
+    """Wrap an arrow function source so Selenium's execute_script runs it."""
+    return "return (" + function_source.strip() + ")();"
+
+
+# Ready-to-send scripts, indexed by whether the browser is Playwright
+_SCRIPTS = {
+    True: {
+        'probe': _BANNER_PROBE_JS,
+        'banner': _BANNER_JS,
+        'pref': _PREF_JS,
+        'clean_all': _CLEAN_ALL_JS,
+        'call_installed': _CALL_INSTALLED_JS,
+        'cleaned': _CLEANED_PROBE_JS,
+    },
+    False: {
+        'probe': _as_selenium_script(_BANNER_PROBE_JS),
+        'banner': _as_selenium_script(_BANNER_JS),
+        'pref': _as_selenium_script(_PREF_JS),
+        'clean_all': _as_selenium_script(_CLEAN_ALL_JS),
+        'call_installed': _as_selenium_script(_CALL_INSTALLED_JS),
+        'cleaned': _as_selenium_script(_CLEANED_PROBE_JS),
+    },
+}
+
+@lru_cache(maxsize=64)
+def _specialized_script(kind, values, is_playwright):
+    """
+    Build a banner or preference-center script for a custom selector list.
+
+    Args:
+        kind: 'banner' or 'pref'
+        values: Tuple of banner selectors or preference keywords
+        is_playwright: Whether to return the Playwright or Selenium form
+
+    Returns:
+        str: Script ready to pass to execute_browser_script
+    """
+    source = _build_banner_js(values) if kind == 'banner' else _build_pref_js(values)
+    return source if is_playwright else _as_selenium_script(source)
 
 def execute_browser_script(browser, script, *args):
     """
     Execute JavaScript in a browser, handling differences between Selenium and Playwright.
-    
+
     Args:
         browser: Browser instance (Selenium WebDriver or Playwright Page)
         script: JavaScript code to execute
         *args: Arguments to pass to the script
-        
+
     Returns:
         The result of the script execution
     """
-    if hasattr(browser, 'evaluate'):
-        # Playwright-style execution
-        return browser.evaluate(script, *args)
-    elif hasattr(browser, 'execute_script'):
-        # Selenium-style execution
-        return browser.execute_script(script, *args)
-    else:
-        raise TypeError("Browser object doesn't support JavaScript execution")
-    
-def dismiss_cookie_consent_banner(browser):
+    executor, _ = _script_dispatch(browser)
+    return executor(script, *args)
+
+def _script_dispatch(browser):
+    """
+    Resolve how to run scripts in a browser, caching the answer on the instance.
+
+    Args:
+        browser: Browser instance (Selenium WebDriver or Playwright Page)
+
+    Returns:
+        tuple: (execute function, whether the browser is Playwright)
+    """
+    # Resolved once per browser so repeated calls skip the attribute probing
+    dispatch = getattr(browser, '_spider_script_dispatch', None)
+    if dispatch is None:
+        if hasattr(browser, 'evaluate'):
+            # Playwright-style execution
+            dispatch = (browser.evaluate, True)
+        elif hasattr(browser, 'execute_script'):
+            # Selenium-style execution
+            dispatch = (browser.execute_script, False)
+        else:
+            raise TypeError("Browser object doesn't support JavaScript execution")
+        browser._spider_script_dispatch = dispatch
+    return dispatch
+
+def install_cookie_cleaner(browser):
+    """
+    Register the cookie cleanup to run automatically on every page the browser loads.
+
+    Playwright pages get it as an init script; Selenium (Chrome) drivers get it
+    through the DevTools Page.addScriptToEvaluateOnNewDocument command.
+
+    Args:
+        browser: Browser instance (Selenium or Playwright)
+
+    Returns:
+        bool: True if the cleanup script was installed
+    """
+    try:
+        if _script_dispatch(browser)[1]:
+            browser.add_init_script(script=_INIT_JS)
+        else:
+            browser.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': _INIT_JS}
+            )
+    except Exception as e:
+        logger.warning("Could not install cookie cleaner: %s", e)
+        return False
+
+    browser._spider_cookie_cleaner = True
+    return True
+
+def _wait_for_banner(browser, timeout=0.5, interval=0.025):
+    """
+    Poll the page until a cookie banner shows up or the timeout expires.
+
+    Args:
+        browser: Browser instance (Selenium or Playwright)
+        timeout: Maximum time to wait in seconds
+        interval: Delay between polls in seconds
+
+    Returns:
+        bool: True if a banner was detected before the timeout
+    """
+    try:
+        script = _SCRIPTS[_script_dispatch(browser)[1]]['probe']
+    except TypeError:
+        return False
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if execute_browser_script(browser, script):
+                return True
+        except Exception:
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+def dismiss_cookie_consent_banner(browser, selectors=None):
     """
     Find cookie consent banner by locating accept buttons,
     then remove the entire banner (which is typically a direct child of body).
-    
+
     Args:
         browser: Browser instance (Selenium or Playwright)
-        
+        selectors: Optional accept-button selectors to use instead of BANNER_SELECTORS
+
     Returns:
         bool: True if banner was found and removed
     """
-    # Allow time for cookie banner to appear
-    time.sleep(0.5)
-    
-    # Common cookie accept button selectors
-    accept_button_selectors = [
-        "[id*='accept']", "[class*='accept']",
-        "button:contains('Accept')", "button:contains('Accept All')",
-        "button:contains('I Accept')", "button:contains('OK')",
-        "button:contains('Agree')", "button:contains('Got it')",
-        "[id*='cookie'] button", "[class*='cookie'] button"
-    ]
-    
+    # Allow time for cookie banner to appear, returning as soon as it does
+    _wait_for_banner(browser)
+
     try:
-        if hasattr(browser, 'evaluate'):  # Playwright
-            # Direct script to find and remove the banner
-            result = browser.evaluate("""
-                () => {
-                    // Common button selectors that indicate cookie banners
-                    const selectors = [
-                        "[id*='accept']", "[class*='accept']",
-                        "button:contains('Accept')", "button:contains('Accept All')",
-                        "button:contains('I Accept')", "button:contains('OK')",
-                        "button:contains('Agree')", "button:contains('Got it')",
-                        "[id*='cookie'] button", "[class*='cookie'] button"
-                    ];
-                    
-                    // Try to find a cookie accept button
-                    let button = null;
-                    for (const selector of selectors) {
-                        try {
-                            const element = document.querySelector(selector);
-                            if (element && element.offsetParent !== null) {
-                                button = element;
-                                break;
-                            }
-                        } catch (e) {
-                            continue;
-                        }
-                    }
-                    
-                    if (!button) return false;
-                    
-                    // Find the top-level container (direct child of body)
-                    let container = button;
-                    while (container.parentElement && container.parentElement !== document.body) {
-                        container = container.parentElement;
-                    }
-                    
-                    // Remove the container if it's a direct child of body
-                    if (container.parentElement === document.body) {
-                        container.remove();
-                        return true;
-                    }
-                    
-                    // Fallback: remove first fixed/absolute position parent
-                    container = button;
-                    while (container.parentElement) {
-                        const style = window.getComputedStyle(container);
-                        if (style.position === 'fixed' || style.position === 'absolute') {
-                            container.remove();
-                            return true;
-                        }
-                        container = container.parentElement;
-                    }
-                    
-                    return false;
-                }
-            """)
-            
-            if result:
-                print("Successfully removed cookie banner")
-                return True
-                
-        else:  # Selenium
-            # Direct script to find and remove the banner
-            result = browser.execute_script("""
-                // Common button selectors that indicate cookie banners
-                const selectors = [
-                    "[id*='accept']", "[class*='accept']", 
-                    "button:contains('Accept')", "button:contains('Accept All')",
-                    "button:contains('I Accept')", "button:contains('OK')",
-                    "button:contains('Agree')", "button:contains('Got it')",
-                    "[id*='cookie'] button", "[class*='cookie'] button"
-                ];
-                
-                // Try to find a cookie accept button
-                let button = null;
-                for (const selector of selectors) {
-                    try {
-                        const elements = document.querySelectorAll(selector);
-                        for (const element of elements) {
-                            if (element && element.offsetParent !== null) {
-                                button = element;
-                                break;
-                            }
-                        }
-                        if (button) break;
-                    } catch (e) {
-                        continue;
-                    }
-                }
-                
-                if (!button) return false;
-                
-                // Find the top-level container (direct child of body)
-                let container = button;
-                while (container.parentElement && container.parentElement !== document.body) {
-                    container = container.parentElement;
-                }
-                
-                // Remove the container if it's a direct child of body
-                if (container.parentElement === document.body) {
-                    container.remove();
-                    return true;
-                }
-                
-                // Fallback: remove first fixed/absolute position parent
-                container = button;
-                while (container.parentElement) {
-                    const style = window.getComputedStyle(container);
-                    if (style.position === 'fixed' || style.position === 'absolute') {
-                        container.remove();
-                        return true;
-                    }
-                    container = container.parentElement;
-                }
-                
-                return false;
-            """)
-            
-            if result:
-                print("Successfully removed cookie banner")
-                return True
-        
+        # Direct script to find and remove the banner
+        is_playwright = _script_dispatch(browser)[1]
+        if selectors is None:
+            script = _SCRIPTS[is_playwright]['banner']
+        else:
+            script = _specialized_script('banner', tuple(selectors), is_playwright)
+        result = execute_browser_script(browser, script)
+
+        if result:
+            logger.debug("Successfully removed cookie banner")
+            return True
+
         return False
-        
+
     except Exception as e:
-        print(f"Error removing cookie banner: {e}")
+        logger.warning("Error removing cookie banner: %s", e)
         return False
-    
-def remove_cookie_preference_center(browser):
+
+def remove_cookie_preference_center(browser, keywords=None):
     """
     Find and remove cookie preference center from the DOM.
     This removes the hidden cookie preference data even after the banner is dismissed.
-    
+
     Args:
         browser: Browser instance (Selenium or Playwright)
-        
+        keywords: Optional id/class keywords to use instead of PREF_KEYWORDS
+
     Returns:
         bool: True if preference center was found and removed
     """
-    
     try:
-        if hasattr(browser, 'evaluate'):  # Playwright
-            # Direct script to find and remove the preference center
-            result = browser.evaluate("""
-                () => {
-                    // Keywords that indicate cookie preference centers
-                    const preferenceKeywords = [
-                        'cookieyes', 'cookie-preferences', 'cookie-settings', 
-                        'cookie-choices', 'consent-preferences', 'consent-manager',
-                        'privacy-manager', 'privacy-preferences', 'gdpr-preferences',
-                        'cookieconsent', 'cookie-law', 'cookie-control', 
-                        'cookie-compliance', 'cookie-policy', 'cookie-notice',
-                        'privacy-center', 'consent-options', 'cookie-details'
-                    ];
-                    
-                    // Find elements containing these keywords in their id, class, or data attributes
-                    const potentialElements = [];
-                    
-                    // Check elements with matching IDs or classes
-                    for (const keyword of preferenceKeywords) {
-                        // Look for ID matches
-                        const idElement = document.getElementById(keyword) || 
-                                         document.querySelector(`[id*="${keyword}"]`);
-                        if (idElement) potentialElements.push(idElement);
-                        
-                        // Look for class matches
-                        const classElements = document.querySelectorAll(`[class*="${keyword}"]`);
-                        for (const el of classElements) potentialElements.push(el);
-                        
-                        // Look for data attribute matches
-                        const dataElements = document.querySelectorAll(`[data-*="${keyword}"]`);
-                        for (const el of dataElements) potentialElements.push(el);
-                    }
-                    
-                    // Check for common cookie preference center containers
-                    const commonSelectors = [
-                        '#cookieYes', '.cookieyes', '#cookieChoices', '.cookie-preferences',
-                        '#gdprContainer', '.gdpr-container', '#cookieConsent', '.cookie-consent',
-                        '#cookiePreferences', '.cookie-preference', '#cookieSettings', '.cookie-settings',
-                        '#consentManager', '.consent-manager', '#cookieControl', '.cookie-control'
-                    ];
-                    
-                    for (const selector of commonSelectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const el of elements) potentialElements.push(el);
-                    }
-                    
-                    // Check elements with text content about cookies/privacy
-                    const divElements = document.querySelectorAll('div');
-                    for (const div of divElements) {
-                        const text = div.innerText ? div.innerText.toLowerCase() : '';
-                        if ((text.includes('cookie') || text.includes('privacy') || 
-                             text.includes('gdpr') || text.includes('consent')) && 
-                            (text.includes('preference') || text.includes('settings') || 
-                             text.includes('choices') || text.includes('options'))) {
-                            potentialElements.push(div);
-                        }
-                    }
-                    
-                    // Process each potential element
-                    for (const element of potentialElements) {
-                        if (!element || !element.parentElement) continue;
-                        
-                        // Find the top-level container (direct child of body)
-                        let container = element;
-                        while (container.parentElement && container.parentElement !== document.body) {
-                            container = container.parentElement;
-                        }
-                        
-                        // Remove the container if it's a direct child of body
-                        if (container.parentElement === document.body) {
-                            container.remove();
-                            return true;
-                        }
-                    }
-                    
-                    // Fallback: look specifically for cookie preference modals/dialogs
-                    const modalSelectors = [
-                        'div[role="dialog"]', '.modal', '.dialog', '#cookie-modal', 
-                        '.cookie-modal', '.consent-modal', '#gdpr-modal'
-                    ];
-                    
-                    for (const selector of modalSelectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const el of elements) {
-                            const text = el.innerText ? el.innerText.toLowerCase() : '';
-                            if (text.includes('cookie') || text.includes('privacy') || 
-                                text.includes('gdpr') || text.includes('consent')) {
-                                el.remove();
-                                return true;
-                            }
-                        }
-                    }
-                    
-                    return false;
-                }
-            """)
-            
-            if result:
-                print("Successfully removed cookie preference center")
-                return True
-                
-        else:  # Selenium
-            # Direct script to find and remove the preference center
-            result = browser.execute_script("""
-                // Keywords that indicate cookie preference centers
-                const preferenceKeywords = [
-                    'cookieyes', 'cookie-preferences', 'cookie-settings', 
-                    'cookie-choices', 'consent-preferences', 'consent-manager',
-                    'privacy-manager', 'privacy-preferences', 'gdpr-preferences',
-                    'cookieconsent', 'cookie-law', 'cookie-control', 
-                    'cookie-compliance', 'cookie-policy', 'cookie-notice',
-                    'privacy-center', 'consent-options', 'cookie-details'
-                ];
-                
-                // Find elements containing these keywords in their id, class, or data attributes
-                const potentialElements = [];
-                
-                // Check elements with matching IDs or classes
-                for (const keyword of preferenceKeywords) {
-                    // Look for ID matches
-                    const idElement = document.getElementById(keyword) || 
-                                     document.querySelector(`[id*="${keyword}"]`);
-                    if (idElement) potentialElements.push(idElement);
-                    
-                    // Look for class matches
-                    const classElements = document.querySelectorAll(`[class*="${keyword}"]`);
-                    for (const el of classElements) potentialElements.push(el);
-                    
-                    // Look for data attribute matches
-                    const dataElements = document.querySelectorAll(`[data-*="${keyword}"]`);
-                    for (const el of dataElements) potentialElements.push(el);
-                }
-                
-                // Check for common cookie preference center containers
-                const commonSelectors = [
-                    '#cookieYes', '.cookieyes', '#cookieChoices', '.cookie-preferences',
-                    '#gdprContainer', '.gdpr-container', '#cookieConsent', '.cookie-consent',
-                    '#cookiePreferences', '.cookie-preference', '#cookieSettings', '.cookie-settings',
-                    '#consentManager', '.consent-manager', '#cookieControl', '.cookie-control'
-                ];
-                
-                for (const selector of commonSelectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const el of elements) potentialElements.push(el);
-                }
-                
-                // Check elements with text content about cookies/privacy
-                const divElements = document.querySelectorAll('div');
-                for (const div of divElements) {
-                    const text = div.innerText ? div.innerText.toLowerCase() : '';
-                    if ((text.includes('cookie') || text.includes('privacy') || 
-                         text.includes('gdpr') || text.includes('consent')) && 
-                        (text.includes('preference') || text.includes('settings') || 
-                         text.includes('choices') || text.includes('options'))) {
-                        potentialElements.push(div);
-                    }
-                }
-                
-                // Process each potential element
-                for (const element of potentialElements) {
-                    if (!element || !element.parentElement) continue;
-                    
-                    // Find the top-level container (direct child of body)
-                    let container = element;
-                    while (container.parentElement && container.parentElement !== document.body) {
-                        container = container.parentElement;
-                    }
-                    
-                    // Remove the container if it's a direct child of body
-                    if (container.parentElement === document.body) {
-                        container.remove();
-                        return true;
-                    }
-                }
-                
-                // Fallback: look specifically for cookie preference modals/dialogs
-                const modalSelectors = [
-                    'div[role="dialog"]', '.modal', '.dialog', '#cookie-modal', 
-                    '.cookie-modal', '.consent-modal', '#gdpr-modal'
-                ];
-                
-                for (const selector of modalSelectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const el of elements) {
-                        const text = el.innerText ? el.innerText.toLowerCase() : '';
-                        if (text.includes('cookie') || text.includes('privacy') || 
-                            text.includes('gdpr') || text.includes('consent')) {
-                            el.remove();
-                            return true;
-                        }
-                    }
-                }
-                
-                return false;
-            """)
-            
-            if result:
-                print("Successfully removed cookie preference center")
-                return True
-        
+        # Direct script to find and remove the preference center
+        is_playwright = _script_dispatch(browser)[1]
+        if keywords is None:
+            script = _SCRIPTS[is_playwright]['pref']
+        else:
+            script = _specialized_script('pref', tuple(keywords), is_playwright)
+        result = execute_browser_script(browser, script)
+
+        if result:
+            logger.debug("Successfully removed cookie preference center")
+            return True
+
         return False
-        
+
     except Exception as e:
-        print(f"Error removing cookie preference center: {e}")
+        logger.warning("Error removing cookie preference center: %s", e)
         return False
-    
+
 def clean_cookie_elements(browser):
     """
     Remove all cookie-related elements from the page:
     1. Cookie consent banners
     2. Cookie preference centers
-    
+
     Args:
         browser: Browser instance (Selenium or Playwright)
-        
+
     Returns:
         int: Number of elements removed (0, 1, or 2)
     """
+    try:
+        # Nothing to do (and no banner to wait for) if this document has
+        # already been cleaned, e.g. by the installed cleaner
+        scripts = _SCRIPTS[_script_dispatch(browser)[1]]
+        if execute_browser_script(browser, scripts['cleaned']):
+            return 0
+    except Exception as e:
+        logger.warning("Error removing cookie elements: %s", e)
+        return 0
+
+    # Allow time for cookie banner to appear, returning as soon as it does
+    _wait_for_banner(browser)
+
+    try:
+        # Remove the banner, then the preference center, in one round trip.
+        # With the cleaner installed the page already holds the compiled
+        # script, so only a short call is sent; the full source is the fallback.
+        result = None
+        if getattr(browser, '_spider_cookie_cleaner', False):
+            result = execute_browser_script(browser, scripts['call_installed'])
+        if result is None:
+            result = execute_browser_script(browser, scripts['clean_all'])
+        banner_removed, pref_removed = result
+    except Exception as e:
+        logger.warning("Error removing cookie elements: %s", e)
+        return 0
+
     removed_count = 0
-    
-    # First remove the banner
-    if dismiss_cookie_consent_banner(browser):
+    if banner_removed:
+        logger.debug("Successfully removed cookie banner")
         removed_count += 1
-    
-    # Then remove the preference center
-    if remove_cookie_preference_center(browser):
+    if pref_removed:
+        logger.debug("Successfully removed cookie preference center")
         removed_count += 1
-    
-    return removed_count
\ No newline at end of file
+
+    return removed_count
@@ -9,13 +9,218 @@ arguments for the spider crawler.
 import argparse
 import os
 import sys
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from .defaults import (
+    DEFAULT_BROWSER_ENGINE,
+    DEFAULT_BROWSER_TYPE,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_INITIAL_DELAY,
+    DEFAULT_MAX_DELAY,
+    DEFAULT_MAX_RESTARTS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MIN_DELAY,
+    DEFAULT_MIN_WORKERS,
+    DEFAULT_OUTPUT,
+    initial_worker_count,
+)
+from .validators import apply_rate_limits
+
+# The parser is built once per process and shared by every caller
+_PARSER = None
+
 
 def create_parser():
     """
     Create the command-line argument parser.
 
+    The parser is built on the first call and the same instance is returned
+    afterwards.
+
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+# Argument definitions, in help order. Each section is (group title, specs);
+# a title of None adds the arguments to the parser itself.
+_ARGUMENT_SECTIONS = (
+    (None, (
+        # Required arguments
+        (("url",), dict(type=str, help="Starting URL to spider from")),
+        # Basic crawling options
+        (("--max-pages",), dict(
+            type=int,
+            default=None,
+            help="Maximum number of pages to spider (default: unlimited)",
+        )),
+        (("--depth",), dict(
+            type=int,
+            default=None,
+            help="Maximum crawl depth from seed URL (default: unlimited)",
+        )),
+        (("--output",), dict(
+            type=str,
+            default=DEFAULT_OUTPUT,
+            help=f"Output CSV file path (default: {DEFAULT_OUTPUT})",
+        )),
+        (("--keywords",), dict(
+            type=str,
+            default="",
+            help="Comma-separated list of keywords to search for",
+        )),
+        (("--path-prefix",), dict(
+            type=str,
+            default=None,
+            help="Optional path prefix to restrict crawling to (e.g., /docs/)",
+        )),
+    )),
+    ("Browser Options", (
+        (("--browser-engine",), dict(
+            type=str,
+            choices=["selenium", "playwright"],
+            default=DEFAULT_BROWSER_ENGINE,
+            help=f"Browser engine to use for crawling (default: {DEFAULT_BROWSER_ENGINE})",
+        )),
+        (("--visible",), dict(
+            action="store_true",
+            help="Run in visible browser mode instead of headless (default: headless)",
+        )),
+        (("--webdriver-path",), dict(
+            type=str,
+            default=None,
+            help="Path to the webdriver executable (optional, Selenium only)",
+        )),
+        (("--browser-type",), dict(
+            type=str,
+            choices=["chromium", "chrome", "firefox", "webkit"],
+            default=DEFAULT_BROWSER_TYPE,
+            help=f"Specific browser to use with Playwright (default: {DEFAULT_BROWSER_TYPE})",
+        )),
+    )),
+    (None, (
+        # Checkpoint options
+        (("--resume",), dict(
+            action="store_true",
+            help="Resume from checkpoint if available (default: false)",
+        )),
+        (("--max-restarts",), dict(
+            type=int,
+            default=DEFAULT_MAX_RESTARTS,
+            help=f"Maximum number of WebDriver restarts (default: {DEFAULT_MAX_RESTARTS})",
+        )),
+        (("--checkpoint-interval",), dict(
+            type=int,
+            default=DEFAULT_CHECKPOINT_INTERVAL,
+            help=f"How often to save checkpoints, in minutes (default: {DEFAULT_CHECKPOINT_INTERVAL})",
+        )),
+    )),
+    # Rate control parameters (limits only)
+    ("Rate Control Options", (
+        (("--max-workers",), dict(
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help=f"Maximum number of parallel workers allowed (default: {DEFAULT_MAX_WORKERS})",
+        )),
+        (("--min-workers",), dict(
+            type=int,
+            default=DEFAULT_MIN_WORKERS,
+            help=f"Minimum number of parallel workers to maintain (default: {DEFAULT_MIN_WORKERS})",
+        )),
+        (("--min-delay",), dict(
+            type=float,
+            default=DEFAULT_MIN_DELAY,
+            help=f"Minimum delay between requests in seconds (default: {DEFAULT_MIN_DELAY})",
+        )),
+        (("--max-delay",), dict(
+            type=float,
+            default=DEFAULT_MAX_DELAY,
+            help=f"Maximum delay between requests in seconds (default: {DEFAULT_MAX_DELAY})",
+        )),
+        (("--initial-delay",), dict(
+            type=float,
+            default=DEFAULT_INITIAL_DELAY,
+            help=f"Initial delay between requests in seconds (default: {DEFAULT_INITIAL_DELAY})",
+        )),
+        (("--disable-adaptive-control",), dict(
+            action="store_true",
+            help="Disable adaptive rate control (not recommended)",
+        )),
+        (("--aggressive-throttling",), dict(
+            action="store_true",
+            help="Use more aggressive throttling when rate limiting is detected",
+        )),
+    )),
+    ("Content Filtering Options", (
+        (("--include-headers",), dict(
+            action="store_true",
+            help="Include header content in keyword search (default: exclude)",
+        )),
+        (("--include-menus",), dict(
+            action="store_true",
+            help="Include menu/navigation content in keyword search (default: exclude)",
+        )),
+        (("--include-footers",), dict(
+            action="store_true",
+            help="Include footer content in keyword search (default: exclude)",
+        )),
+        (("--include-sidebars",), dict(
+            action="store_true",
+            help="Include sidebar content in keyword search (default: exclude)",
+        )),
+        (("--exclude-selectors",), dict(
+            type=str,
+            default="",
+            help='Comma-separated CSS selectors to exclude (e.g., ".ads,.comments")',
+        )),
+    )),
+    ("Domain Options", (
+        (("--allow-subdomains",), dict(
+            action="store_true",
+            help="Allow crawling across different subdomains of the same domain (default: stay on initial subdomain)",
+        )),
+        (("--allowed-extensions",), dict(
+            type=str,
+            default="",
+            help='Comma-separated list of additional file extensions to allow (e.g., ".pdf,.docx")',
+        )),
+    )),
+    ("Special Modes", (
+        (("--spa",), dict(
+            action="store_true",
+            help="Enable Single Page Application (SPA) mode with enhanced JavaScript support",
+        )),
+        (("--markdown-mode",), dict(
+            action="store_true",
+            help="Extract and save page content as markdown files instead of keyword searching",
+        )),
+        (("--include-all-content",), dict(
+            action="store_true",
+            help="When using markdown mode, include all page content (headers, menus, etc.)",
+        )),
+    )),
+    ("Configuration Options", (
+        (("--config",), dict(
+            type=str, default=None, help="Path to configuration file (JSON)"
+        )),
+        (("--save-config",), dict(
+            type=str,
+            default=None,
+            help="Save current settings to configuration file",
+        )),
+    )),
+)
+
+
+def _build_parser():
+    """
+    Build the command-line argument parser from _ARGUMENT_SECTIONS.
+
     Returns:
         argparse.ArgumentParser: Configured argument parser
     """
@@ -23,206 +228,47 @@ def create_parser():
         description="Spider a website for specific keywords using parallel processes with adaptive rate control"
     )
 
-    # Required arguments
-    parser.add_argument("url", type=str, help="Starting URL to spider from")
+    for title, specs in _ARGUMENT_SECTIONS:
+        target = parser if title is None else parser.add_argument_group(title)
+        for flags, options in specs:
+            target.add_argument(*flags, **options)
 
-    # Basic crawling options
-    parser.add_argument(
-        "--max-pages",
-        type=int,
-        default=None,
-        help="Maximum number of pages to spider (default: unlimited)",
-    )
-    parser.add_argument(
-        "--depth",
-        type=int,
-        default=None,
-        help="Maximum crawl depth from seed URL (default: unlimited)",
-    )
-    parser.add_argument(
-        "--output",
-        type=str,
-        default="keyword_report.csv",
-        help="Output CSV file path (default: keyword_report.csv)",
-    )
-    parser.add_argument(
-        "--keywords",
-        type=str,
-        default="",
-        help="Comma-separated list of keywords to search for",
-    )
-    parser.add_argument(
-        "--path-prefix",
-        type=str,
-        default=None,
-        help="Optional path prefix to restrict crawling to (e.g., /docs/)",
-    )
+    return parser
 
-    # Browser options
-    browser_group = parser.add_argument_group("Browser Options")
-    browser_group.add_argument(
-        "--browser-engine",
-        type=str,
-        choices=["selenium", "playwright"],
-        default="selenium",
-        help="Browser engine to use for crawling (default: selenium)"
-    )
-    browser_group.add_argument(
-        "--visible",
-        action="store_true",
-        help="Run in visible browser mode instead of headless (default: headless)",
-    )
-    browser_group.add_argument(
-        "--webdriver-path",
-        type=str,
-        default=None,
-        help="Path to the webdriver executable (optional, Selenium only)",
-    )
 
-    browser_group.add_argument(
-        "--browser-type",
-        type=str,
-        choices=["chromium", "chrome", "firefox", "webkit"],
-        default="chrome",
-        help="Specific browser to use with Playwright (default: chrome)"
-    )
+def _split_csv(value):
+    """
+    Split a comma-separated argument into its non-empty, stripped items.
 
-    # Checkpoint options
-    parser.add_argument(
-        "--resume",
-        action="store_true",
-        help="Resume from checkpoint if available (default: false)",
-    )
-    parser.add_argument(
-        "--max-restarts",
-        type=int,
-        default=3,
-        help="Maximum number of WebDriver restarts (default: 3)",
-    )
-    parser.add_argument(
-        "--checkpoint-interval",
-        type=int,
-        default=10,
-        help="How often to save checkpoints, in minutes (default: 10)",
-    )
+    Args:
+        value: Comma-separated string
 
-    # Rate control parameters (limits only)
-    rate_group = parser.add_argument_group("Rate Control Options")
-    rate_group.add_argument(
-        "--max-workers",
-        type=int,
-        default=8,
-        help="Maximum number of parallel workers allowed (default: 8)",
-    )
-    rate_group.add_argument(
-        "--min-workers",
-        type=int,
-        default=1,
-        help="Minimum number of parallel workers to maintain (default: 1)",
-    )
-    rate_group.add_argument(
-        "--min-delay",
-        type=float,
-        default=0.5,
-        help="Minimum delay between requests in seconds (default: 0.5)",
-    )
-    rate_group.add_argument(
-        "--max-delay",
-        type=float,
-        default=30.0,
-        help="Maximum delay between requests in seconds (default: 30.0)",
-    )
-    rate_group.add_argument(
-        "--initial-delay",
-        type=float,
-        default=1.0,
-        help="Initial delay between requests in seconds (default: 1.0)",
-    )
-    rate_group.add_argument(
-        "--disable-adaptive-control",
-        action="store_true",
-        help="Disable adaptive rate control (not recommended)",
-    )
-    rate_group.add_argument(
-        "--aggressive-throttling",
-        action="store_true",
-        help="Use more aggressive throttling when rate limiting is detected",
-    )
+    Returns:
+        tuple: Items in their original order
+    """
+    # Strip each item once, then drop the empty ones
+    return tuple(item for item in (part.strip() for part in value.split(",")) if item)
 
-    # Content filtering options
-    content_group = parser.add_argument_group("Content Filtering Options")
-    content_group.add_argument(
-        "--include-headers",
-        action="store_true",
-        help="Include header content in keyword search (default: exclude)",
-    )
-    content_group.add_argument(
-        "--include-menus",
-        action="store_true",
-        help="Include menu/navigation content in keyword search (default: exclude)",
-    )
-    content_group.add_argument(
-        "--include-footers",
-        action="store_true",
-        help="Include footer content in keyword search (default: exclude)",
-    )
-    content_group.add_argument(
-        "--include-sidebars",
-        action="store_true",
-        help="Include sidebar content in keyword search (default: exclude)",
-    )
-    content_group.add_argument(
-        "--exclude-selectors",
-        type=str,
-        default="",
-        help='Comma-separated CSS selectors to exclude (e.g., ".ads,.comments")',
-    )
 
-    # Domain crawling options
-    domain_group = parser.add_argument_group("Domain Options")
-    domain_group.add_argument(
-        "--allow-subdomains",
-        action="store_true",
-        help="Allow crawling across different subdomains of the same domain (default: stay on initial subdomain)",
-    )
-    domain_group.add_argument(
-        "--allowed-extensions",
-        type=str,
-        default="",
-        help='Comma-separated list of additional file extensions to allow (e.g., ".pdf,.docx")',
-    )
+@lru_cache(maxsize=64)
+def _default_output(netloc, markdown_mode):
+    """
+    Derive the default output filename from a site's network location.
 
-    # Special modes
-    mode_group = parser.add_argument_group("Special Modes")
-    mode_group.add_argument(
-        "--spa",
-        action="store_true",
-        help="Enable Single Page Application (SPA) mode with enhanced JavaScript support",
-    )
-    mode_group.add_argument(
-        "--markdown-mode",
-        action="store_true",
-        help="Extract and save page content as markdown files instead of keyword searching",
-    )
-    mode_group.add_argument(
-        "--include-all-content",
-        action="store_true",
-        help="When using markdown mode, include all page content (headers, menus, etc.)",
-    )
+    Args:
+        netloc: Network location of the starting URL (e.g. "example.com")
+        markdown_mode: Whether the crawl saves markdown instead of searching
 
-    # Configuration file options
-    config_group = parser.add_argument_group("Configuration Options")
-    config_group.add_argument(
-        "--config", type=str, default=None, help="Path to configuration file (JSON)"
-    )
-    config_group.add_argument(
-        "--save-config",
-        type=str,
-        default=None,
-        help="Save current settings to configuration file",
-    )
+    Returns:
+        str: Output filename
+    """
+    # Create a filename based on the domain
+    domain = netloc.replace(".", "_")
 
-    return parser
+    if markdown_mode:
+        # In markdown mode, we don't need a CSV output file, but still need a base name for checkpoint
+        return f"{domain}_checkpoint_data.csv"
+    return f"{domain}_keyword_report.csv"
 
 
 def parse_args(args=None):
@@ -241,16 +287,19 @@ def parse_args(args=None):
     parser = create_parser()
     parsed_args = parser.parse_args(args)
 
-    # Validate URL
+    # Validate URL (urlparse only raises for malformed hosts such as a bad IPv6 literal)
     try:
         parsed_url = urlparse(parsed_args.url)
-        if not parsed_url.scheme or not parsed_url.netloc:
-            raise ValueError("Invalid URL format")
-    except:
+    except ValueError:
+        parsed_url = None
+    if parsed_url is None or not parsed_url.scheme or not parsed_url.netloc:
         parser.error(
             "Invalid URL. Please provide a valid URL (e.g., https://example.com)"
         )
 
+    # Keep the parse result so later steps don't have to parse the URL again
+    parsed_args._parsed_url = parsed_url
+
     # Handle keyword requirement (except in markdown mode)
     if not parsed_args.keywords and not parsed_args.markdown_mode:
         if sys.stdin.isatty():  # Interactive mode
@@ -261,25 +310,17 @@ def parse_args(args=None):
                 "No keywords provided. Please specify keywords with --keywords."
             )
 
-    # Process keywords into a list
+    # Process keywords into a tuple
     if parsed_args.keywords:
-        parsed_args.keywords = [
-            k.strip() for k in parsed_args.keywords.split(",") if k.strip()
-        ]
+        parsed_args.keywords = _split_csv(parsed_args.keywords)
     elif parsed_args.markdown_mode:
-        parsed_args.keywords = ["placeholder"]  # Placeholder for markdown mode
+        parsed_args.keywords = ("placeholder",)  # Placeholder for markdown mode
 
     # Generate output filename if not specified
-    if parsed_args.output == "keyword_report.csv":
-        # Create a filename based on the domain
-        parsed_url = urlparse(parsed_args.url)
-        domain = parsed_url.netloc.replace(".", "_")
-
-        if parsed_args.markdown_mode:
-            # In markdown mode, we don't need a CSV output file, but still need a base name for checkpoint
-            parsed_args.output = f"{domain}_checkpoint_data.csv"
-        else:
-            parsed_args.output = f"{domain}_keyword_report.csv"
+    if parsed_args.output == DEFAULT_OUTPUT:
+        parsed_args.output = _default_output(
+            parsed_url.netloc, parsed_args.markdown_mode
+        )
 
     # Check for checkpoint file if --resume is specified
     if parsed_args.resume:
@@ -292,44 +333,22 @@ def parse_args(args=None):
 
     # Process allowed extensions
     if parsed_args.allowed_extensions:
-        exts = set(
-            ext.strip()
-            for ext in parsed_args.allowed_extensions.split(",")
-            if ext.strip()
-        )
         # Ensure extensions start with a dot
-        parsed_args.allowed_extensions = {
-            ext if ext.startswith(".") else "." + ext for ext in exts
-        }
+        parsed_args.allowed_extensions = frozenset(
+            ext if ext.startswith(".") else "." + ext
+            for ext in _split_csv(parsed_args.allowed_extensions)
+        )
     else:
         parsed_args.allowed_extensions = None
 
     # Process content filter exclude selectors
     if parsed_args.exclude_selectors:
-        parsed_args.exclude_selectors = [
-            s.strip() for s in parsed_args.exclude_selectors.split(",") if s.strip()
-        ]
+        parsed_args.exclude_selectors = _split_csv(parsed_args.exclude_selectors)
     else:
-        parsed_args.exclude_selectors = []
+        parsed_args.exclude_selectors = ()
 
     # Validate rate control parameters
-    if parsed_args.min_workers > parsed_args.max_workers:
-        print(
-            f"Warning: min_workers ({parsed_args.min_workers}) exceeds max_workers ({parsed_args.max_workers}). Setting min_workers to {parsed_args.max_workers}."
-        )
-        parsed_args.min_workers = parsed_args.max_workers
-
-    if parsed_args.initial_delay < parsed_args.min_delay:
-        print(
-            f"Warning: initial_delay ({parsed_args.initial_delay}) is less than min_delay ({parsed_args.min_delay}). Setting initial_delay to {parsed_args.min_delay}."
-        )
-        parsed_args.initial_delay = parsed_args.min_delay
-
-    if parsed_args.min_delay > parsed_args.max_delay:
-        print(
-            f"Warning: min_delay ({parsed_args.min_delay}) exceeds max_delay ({parsed_args.max_delay}). Setting min_delay to {parsed_args.max_delay}."
-        )
-        parsed_args.min_delay = parsed_args.max_delay
+    apply_rate_limits(parsed_args)
 
     return parsed_args
 
@@ -341,61 +360,64 @@ def print_config_summary(args):
     Args:
         args: Parsed arguments
     """
-    print(f"\nStarting adaptive spider with the following configuration:")
-    print(f"- Starting URL: {args.url}")
+    # Collect the lines and write them in one go rather than print by print
+    lines = []
+    lines.append(f"\nStarting adaptive spider with the following configuration:")
+    lines.append(f"- Starting URL: {args.url}")
 
     if args.markdown_mode:
-        print(f"- Mode: Markdown extraction (saving page content as .md files)")
+        lines.append(f"- Mode: Markdown extraction (saving page content as .md files)")
         if args.include_all_content:
-            print(f"  - Including all page content (headers, menus, footers, sidebars)")
+            lines.append(f"  - Including all page content (headers, menus, footers, sidebars)")
         else:
-            print(f"  - Filtering content based on content filter settings")
+            lines.append(f"  - Filtering content based on content filter settings")
     else:
-        print(f"- Mode: Keyword search")
-        print(f"- Keywords: {args.keywords}")
-        print(f"- Output file: {args.output}")
-
-    print(f"- Max pages: {'Unlimited' if args.max_pages is None else args.max_pages}")
-    print(f"- Max depth: {'Unlimited' if args.depth is None else args.depth}")  # Added depth display
-    print(f"- Rate control:")
-    print(
-        f"  - Initial workers: {args.min_workers + (args.max_workers - args.min_workers) // 2} (will adjust automatically)"
-    )
-    print(f"  - Min/Max workers: {args.min_workers}-{args.max_workers}")
-    print(f"  - Initial delay: {args.initial_delay}s (will adjust automatically)")
-    print(f"  - Min/Max delay: {args.min_delay}s-{args.max_delay}s")
-    print(
+        lines.append(f"- Mode: Keyword search")
+        lines.append(f"- Keywords: {args.keywords}")
+        lines.append(f"- Output file: {args.output}")
+
+    lines.append(f"- Max pages: {'Unlimited' if args.max_pages is None else args.max_pages}")
+    lines.append(f"- Max depth: {'Unlimited' if args.depth is None else args.depth}")  # Added depth display
+    lines.append(f"- Rate control:")
+    lines.append(
+        f"  - Initial workers: {initial_worker_count(args.min_workers, args.max_workers)} (will adjust automatically)"
+    )
+    lines.append(f"  - Min/Max workers: {args.min_workers}-{args.max_workers}")
+    lines.append(f"  - Initial delay: {args.initial_delay}s (will adjust automatically)")
+    lines.append(f"  - Min/Max delay: {args.min_delay}s-{args.max_delay}s")
+    lines.append(
         f"  - Adaptive control: {'Disabled' if args.disable_adaptive_control else 'Enabled'}"
     )
-    print(
+    lines.append(
         f"  - Throttling strategy: {'Aggressive' if args.aggressive_throttling else 'Standard'}"
     )
 
     if args.path_prefix:
-        print(f"- Path prefix: {args.path_prefix}")
-    print(f"- Browser mode: {'Visible' if args.visible else 'Headless'}")
-    print(f"- Browser engine: {args.browser_engine}")
-    print(f"- Browser engine: {args.browser_type}")
-    print(f"- Browser mode: {'Visible' if args.visible else 'Headless'}")
-    print(f"- Resume from checkpoint: {'Yes' if args.resume else 'No'}")
-    print(f"- Max restarts: {args.max_restarts}")
-    print(f"- Checkpoint interval: Every {args.checkpoint_interval} minutes")
-    print(f"- Content filtering:")
-    print(f"  - Include headers: {args.include_headers}")
-    print(f"  - Include menus: {args.include_menus}")
-    print(f"  - Include footers: {args.include_footers}")
-    print(f"  - Include sidebars: {args.include_sidebars}")
+        lines.append(f"- Path prefix: {args.path_prefix}")
+    lines.append(f"- Browser mode: {'Visible' if args.visible else 'Headless'}")
+    lines.append(f"- Browser engine: {args.browser_engine}")
+    lines.append(f"- Browser engine: {args.browser_type}")
+    lines.append(f"- Browser mode: {'Visible' if args.visible else 'Headless'}")
+    lines.append(f"- Resume from checkpoint: {'Yes' if args.resume else 'No'}")
+    lines.append(f"- Max restarts: {args.max_restarts}")
+    lines.append(f"- Checkpoint interval: Every {args.checkpoint_interval} minutes")
+    lines.append(f"- Content filtering:")
+    lines.append(f"  - Include headers: {args.include_headers}")
+    lines.append(f"  - Include menus: {args.include_menus}")
+    lines.append(f"  - Include footers: {args.include_footers}")
+    lines.append(f"  - Include sidebars: {args.include_sidebars}")
     if args.exclude_selectors:
-        print(f"  - Custom exclude selectors: {', '.join(args.exclude_selectors)}")
-    print(f"- Allow crawling across subdomains: {args.allow_subdomains}")
-    print(f"- Resource filtering:")
-    print(
+        lines.append(f"  - Custom exclude selectors: {', '.join(args.exclude_selectors)}")
+    lines.append(f"- Allow crawling across subdomains: {args.allow_subdomains}")
+    lines.append(f"- Resource filtering:")
+    lines.append(
         f"  - Non-webpage resources: {'Allowed extensions: ' + ', '.join(args.allowed_extensions) if args.allowed_extensions else 'Excluded (default)'}"
     )
 
     # Print SPA mode if enabled
     if args.spa:
-        print(
+        lines.append(
             f"- SPA mode: Enabled (enhanced JavaScript support for single-page applications)"
         )
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -6,14 +6,32 @@ This module provides functionality for loading and saving configuration
 files, and for managing crawler configuration.
 """
 
-import json
 import os
-from dataclasses import asdict, dataclass, field
-from typing import List, Optional, Set
-from urllib.parse import urlparse
-
-
-@dataclass
+import sys
+from dataclasses import MISSING, InitVar, dataclass, fields
+from typing import FrozenSet, Optional, Tuple
+
+from .defaults import (
+    DEFAULT_BROWSER_ENGINE,
+    DEFAULT_BROWSER_TYPE,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_INITIAL_DELAY,
+    DEFAULT_MAX_DELAY,
+    DEFAULT_MAX_RESTARTS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MIN_DELAY,
+    DEFAULT_MIN_WORKERS,
+    DEFAULT_OUTPUT,
+    initial_worker_count,
+)
+from .validators import apply_rate_limits
+
+# Slotted instances skip the per-instance __dict__, which makes them smaller
+# to pickle and faster to read; dataclasses only support this from 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Configuration:
     """
     Configuration class for the spider crawler.
@@ -24,8 +42,8 @@ class Configuration:
 
     # URL and basic parameters
     url: str
-    output_file: str = "keyword_report.csv"
-    keywords: List[str] = field(default_factory=list)
+    output_file: str = DEFAULT_OUTPUT
+    keywords: Tuple[str, ...] = ()
     max_pages: Optional[int] = None
     depth: Optional[int] = None  # Added depth parameter
     path_prefix: Optional[str] = None
@@ -33,19 +51,19 @@ class Configuration:
     # Browser configuration
     headless: bool = True
     webdriver_path: Optional[str] = None
-    max_restarts: int = 3
+    max_restarts: int = DEFAULT_MAX_RESTARTS
 
     # Checkpoint configuration
     resume: bool = False
-    checkpoint_interval: int = 10  # minutes
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL  # minutes
 
     # Rate control
-    min_workers: int = 1
-    max_workers: int = 8
-    initial_workers: int = 4
-    min_delay: float = 0.5
-    max_delay: float = 30.0
-    initial_delay: float = 1.0
+    min_workers: int = DEFAULT_MIN_WORKERS
+    max_workers: int = DEFAULT_MAX_WORKERS
+    initial_workers: int = initial_worker_count(DEFAULT_MIN_WORKERS, DEFAULT_MAX_WORKERS)
+    min_delay: float = DEFAULT_MIN_DELAY
+    max_delay: float = DEFAULT_MAX_DELAY
+    initial_delay: float = DEFAULT_INITIAL_DELAY
     adaptive_rate_control: bool = True
     aggressive_throttling: bool = False
     response_window_size: int = 20
@@ -55,28 +73,39 @@ class Configuration:
     include_menus: bool = False
     include_footers: bool = False
     include_sidebars: bool = False
-    exclude_selectors: List[str] = field(default_factory=list)
+    exclude_selectors: Tuple[str, ...] = ()
 
     # Domain configuration
     allow_subdomains: bool = False
-    allowed_extensions: Optional[Set[str]] = None
+    allowed_extensions: Optional[FrozenSet[str]] = None
 
     # Special modes
     spa_mode: bool = False
     markdown_mode: bool = False
     include_all_content: bool = False
 
-    browser_engine: str = "selenium"
-    browser_type: str = "chromium"
+    browser_engine: str = DEFAULT_BROWSER_ENGINE
+    browser_type: str = DEFAULT_BROWSER_TYPE
+
+    # Already-parsed form of url, if the caller has one; not stored
+    parsed_url: InitVar[Optional[object]] = None
 
-    def __post_init__(self):
+    def __post_init__(self, parsed_url):
         """Validate configuration after initialization."""
-        # Validate URL
-        try:
-            parsed_url = urlparse(self.url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                raise ValueError("Invalid URL format")
-        except:
+        # Store the lists as immutable tuples, whatever sequence was passed in
+        self.keywords = tuple(self.keywords)
+        self.exclude_selectors = tuple(self.exclude_selectors)
+
+        # Validate URL, reusing the caller's parse result when there is one
+        from urllib.parse import urlparse
+
+        if parsed_url is None:
+            try:
+                parsed_url = urlparse(self.url)
+            except (AttributeError, TypeError, ValueError):
+                # Not a string, or a malformed host such as a bad IPv6 literal
+                raise ValueError(f"Invalid URL: {self.url}")
+        if not parsed_url.scheme or not parsed_url.netloc:
             raise ValueError(f"Invalid URL: {self.url}")
 
         # Ensure keywords are present (except in markdown mode)
@@ -84,36 +113,17 @@ class Configuration:
             raise ValueError("Keywords are required for keyword search mode")
 
         # Ensure rate control parameters are valid
-        if self.min_workers > self.max_workers:
-            print(
-                f"Warning: min_workers ({self.min_workers}) exceeds max_workers ({self.max_workers}). Setting min_workers to {self.max_workers}."
-            )
-            self.min_workers = self.max_workers
-
-        if self.initial_delay < self.min_delay:
-            print(
-                f"Warning: initial_delay ({self.initial_delay}) is less than min_delay ({self.min_delay}). Setting initial_delay to {self.min_delay}."
-            )
-            self.initial_delay = self.min_delay
-
-        if self.min_delay > self.max_delay:
-            print(
-                f"Warning: min_delay ({self.min_delay}) exceeds max_delay ({self.max_delay}). Setting min_delay to {self.max_delay}."
-            )
-            self.min_delay = self.max_delay
+        apply_rate_limits(self)
 
         # Set initial workers to a reasonable value
-        self.initial_workers = min(
-            self.max_workers,
-            max(self.min_workers, (self.min_workers + self.max_workers) // 2),
-        )
+        self.initial_workers = initial_worker_count(self.min_workers, self.max_workers)
 
         # Normalize allowed extensions
         if self.allowed_extensions:
-            self.allowed_extensions = {
+            self.allowed_extensions = frozenset(
                 ext if ext.startswith(".") else "." + ext
                 for ext in self.allowed_extensions
-            }
+            )
 
     @classmethod
     def from_args(cls, args):
@@ -142,8 +152,7 @@ class Configuration:
             checkpoint_interval=args.checkpoint_interval,
             min_workers=args.min_workers,
             max_workers=args.max_workers,
-            initial_workers=args.min_workers
-            + (args.max_workers - args.min_workers) // 2,
+            initial_workers=initial_worker_count(args.min_workers, args.max_workers),
             min_delay=args.min_delay,
             max_delay=args.max_delay,
             initial_delay=args.initial_delay,
@@ -159,6 +168,7 @@ class Configuration:
             spa_mode=args.spa,
             markdown_mode=args.markdown_mode,
             include_all_content=args.include_all_content,
+            parsed_url=getattr(args, "_parsed_url", None),
         )
 
     def to_dict(self):
@@ -168,12 +178,13 @@ class Configuration:
         Returns:
             dict: Dictionary representation of the configuration
         """
-        # Use dataclasses.asdict to convert to dict
-        config_dict = asdict(self)
+        # Every field holds a primitive, tuple or frozenset, so a shallow
+        # snapshot is enough (asdict would deep-copy each value)
+        config_dict = {f.name: getattr(self, f.name) for f in fields(self)}
 
-        # Convert sets to lists for JSON serialization
+        # Convert frozensets to sorted lists for stable JSON serialization
         if config_dict["allowed_extensions"]:
-            config_dict["allowed_extensions"] = list(config_dict["allowed_extensions"])
+            config_dict["allowed_extensions"] = sorted(config_dict["allowed_extensions"])
 
         return config_dict
 
@@ -191,14 +202,65 @@ class Configuration:
         # Make a copy to avoid modifying the original
         config = config_dict.copy()
 
-        # Convert allowed_extensions list back to set
+        # Convert allowed_extensions list back to a frozenset
         if "allowed_extensions" in config and config["allowed_extensions"]:
-            config["allowed_extensions"] = set(config["allowed_extensions"])
+            config["allowed_extensions"] = frozenset(config["allowed_extensions"])
 
         # Create instance
         return cls(**config)
 
 
+# Names of the stored Configuration fields, for cheap membership checks
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Configuration))
+
+# Default value of each Configuration field that has one
+_CONFIG_DEFAULTS = {
+    f.name: f.default for f in fields(Configuration) if f.default is not MISSING
+}
+
+
+def _decode_json(data):
+    """
+    Decode JSON from bytes, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error
+            type is a subclass of it)
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _encode_json(obj):
+    """
+    Encode an object as indented JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: The encoded document
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
 def load_config(config_file: str) -> Configuration:
     """
     Load configuration from a JSON file.
@@ -214,12 +276,16 @@ def load_config(config_file: str) -> Configuration:
         json.JSONDecodeError: If the configuration file is not valid JSON
         KeyError: If the configuration file is missing required fields
     """
-    if not os.path.exists(config_file):
+    import json
+
+    try:
+        with open(config_file, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
     try:
-        with open(config_file, "r") as f:
-            config_dict = json.load(f)
+        config_dict = _decode_json(data)
 
         # Check for required fields
         required_fields = ["url"]
@@ -252,12 +318,12 @@ def save_config(config: Configuration, config_file: str) -> None:
 
         # Create directory if it doesn't exist
         directory = os.path.dirname(os.path.abspath(config_file))
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
         # Write to file
-        with open(config_file, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        with open(config_file, "wb") as f:
+            f.write(_encode_json(config_dict))
 
         print(f"Configuration saved to {config_file}")
 
@@ -304,31 +370,23 @@ def _override_config_from_args(config, args):
     Returns:
         Configuration: Updated configuration
     """
-    # Get default argument values
-    parser = create_parser()
-    defaults = vars(parser.parse_args([config.url]))
-
     # Get actual argument values
     arg_dict = vars(args)
 
     # Override config with explicitly specified arguments
     for key, value in arg_dict.items():
-        # Skip if the value is the same as the default
-        if value != defaults.get(key):
-            # Special handling for certain fields
-            if key == "visible":
-                config.headless = not value
-            elif key == "disable_adaptive_control":
-                config.adaptive_rate_control = not value
-            elif key == "spa":
-                config.spa_mode = value
-            else:
-                # For other fields, set directly if they exist in the config
-                if hasattr(config, key):
-                    setattr(config, key, value)
+        # Special handling for arguments stored under another field name
+        if key == "visible":
+            key, value = "headless", not value
+        elif key == "disable_adaptive_control":
+            key, value = "adaptive_rate_control", not value
+        elif key == "spa":
+            key = "spa_mode"
+
+        # Set fields that exist in the config, skipping values that are the
+        # same as the default
+        if key in _CONFIG_FIELDS and value != _CONFIG_DEFAULTS.get(key):
+            setattr(config, key, value)
 
     return config
 
-
-# Import here to avoid circular imports
-from .argument_parser import create_parser
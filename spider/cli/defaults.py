@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Default values for command-line arguments.
+
+This module holds the defaults shared by the argument parser and the
+configuration module, and the initial worker count derived from the worker
+limits, so neither has to import the other to know them.
+"""
+
+# Basic crawling options
+DEFAULT_OUTPUT = "keyword_report.csv"
+
+# Browser options
+DEFAULT_BROWSER_ENGINE = "selenium"
+DEFAULT_BROWSER_TYPE = "chrome"
+
+# Checkpoint options
+DEFAULT_MAX_RESTARTS = 3
+DEFAULT_CHECKPOINT_INTERVAL = 10  # minutes
+
+# Rate control options
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MIN_WORKERS = 1
+DEFAULT_MIN_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_INITIAL_DELAY = 1.0
+
+
+def initial_worker_count(min_workers, max_workers):
+    """
+    Work out how many workers to start with: the midpoint of the allowed range.
+
+    Args:
+        min_workers: Minimum number of workers
+        max_workers: Maximum number of workers
+
+    Returns:
+        int: Initial worker count, clamped to [min_workers, max_workers]
+    """
+    return min(max_workers, max(min_workers, (min_workers + max_workers) // 2))
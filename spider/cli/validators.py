@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Validation helpers shared by argument parsing and configuration.
+
+This module holds the rate-control consistency rules so the command-line
+parser and the Configuration class apply exactly the same checks.
+"""
+
+# Rate-control rules, applied in order: (attribute, bounding attribute,
+# relation that is not allowed). A violating attribute is clamped to its bound.
+RATE_LIMIT_RULES = (
+    ("min_workers", "max_workers", "exceeds"),
+    ("initial_delay", "min_delay", "is less than"),
+    ("min_delay", "max_delay", "exceeds"),
+)
+
+
+def clamp_and_warn(obj, attr, bound_attr, relation):
+    """
+    Clamp an attribute to another attribute's value if it is out of range.
+
+    Args:
+        obj: Object holding both attributes (parsed arguments or a Configuration)
+        attr: Name of the attribute to check
+        bound_attr: Name of the attribute that bounds it
+        relation: "exceeds" if attr must not be greater than the bound,
+            "is less than" if it must not be smaller
+
+    Returns:
+        bool: True if the attribute was clamped
+    """
+    value = getattr(obj, attr)
+    bound = getattr(obj, bound_attr)
+    if relation == "exceeds":
+        out_of_range = value > bound
+    else:
+        out_of_range = value < bound
+    if not out_of_range:
+        return False
+
+    print(
+        f"Warning: {attr} ({value}) {relation} {bound_attr} ({bound}). Setting {attr} to {bound}."
+    )
+    setattr(obj, attr, bound)
+    return True
+
+
+def apply_rate_limits(obj):
+    """
+    Apply every rule in RATE_LIMIT_RULES to an object, in order.
+
+    Args:
+        obj: Object holding the rate-control attributes
+    """
+    for attr, bound_attr, relation in RATE_LIMIT_RULES:
+        clamp_and_warn(obj, attr, bound_attr, relation)
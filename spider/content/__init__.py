@@ -3,18 +3,35 @@ Content processing module for handling HTML content, keyword extraction, and con
 
 This package contains components for filtering, parsing, analyzing, and
 transforming web page content.
+
+Submodules are imported on first attribute access (PEP 562), so importing the
+package does not pull in BeautifulSoup or html2text until they are needed.
 """
 
-from .extractor import extract_context, search_page_for_keywords
-from .filter import ContentFilter
-from .markdown import html_to_markdown, save_markdown_file
-from .parser import determine_page_category
+from .._lazy import lazy_exports
+
+# Exported name -> submodule that defines it
+_LAZY_ATTRS = {
+    "extract_context": ".extractor",
+    "extract_keywords_from_html": ".extractor",
+    "search_page_for_keywords": ".extractor",
+    "ContentFilter": ".filter",
+    "html_to_markdown": ".markdown",
+    "save_markdown_file": ".markdown",
+    "soup_to_markdown": ".markdown",
+    "determine_page_category": ".parser",
+}
 
 __all__ = [
     "ContentFilter",
     "search_page_for_keywords",
     "extract_context",
+    "extract_keywords_from_html",
     "determine_page_category",
     "html_to_markdown",
     "save_markdown_file",
+    "soup_to_markdown",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS, __all__)
@@ -7,8 +7,164 @@ including keyword searching and context extraction.
 """
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+
+from .._optional import load_ahocorasick
+
+# Sentence boundaries: end punctuation followed by whitespace and a capital
+# letter or digit, skipping common abbreviations and decimals. The cheap
+# end-punctuation lookbehind comes first so most positions are rejected
+# before the abbreviation lookbehinds run.
+_SENTENCE_SPLIT_RE = re.compile(
+    r"(?<=[.?!])(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<!\d\.)\s+(?=[A-Z0-9])"
+)
+
+# Runs of whitespace, including newlines
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Most characters of context kept on either side of a keyword match
+CONTEXT_CHARS = 300
+
+# Elements whose text is searched for keywords
+TEXT_TAGS = frozenset(["p", "li", "h1", "h2", "h3", "h4", "h5", "h6", "div", "span"])
+
+
+def _iter_text_blocks(root):
+    """
+    Yield the outermost TEXT_TAGS elements under root, in document order.
+
+    Elements nested inside a yielded block are not visited, so each piece of
+    text belongs to exactly one block (a <p> inside a <div> is covered by the
+    <div> alone).
+
+    Args:
+        root: BeautifulSoup object or Tag to walk
+
+    Returns:
+        generator: Tag objects
+    """
+    stack = [child for child in reversed(root.contents) if isinstance(child, Tag)]
+    while stack:
+        element = stack.pop()
+        if element.name in TEXT_TAGS:
+            yield element
+        else:
+            stack.extend(
+                child for child in reversed(element.contents) if isinstance(child, Tag)
+            )
+
+
+# pyahocorasick is optional. When present, all keywords are found in a single
+# pass over the page text; otherwise each keyword gets its own regex scan.
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton over the lowercased keywords.
+
+    Args:
+        keywords: Tuple of keywords
+
+    Returns:
+        ahocorasick.Automaton: Automaton whose values are the lowercased
+        keywords, or None if pyahocorasick is unavailable or a keyword
+        cannot be matched by simple lowercasing
+    """
+    ahocorasick = load_ahocorasick()
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        word = keyword.lower()
+        # Positions are mapped back onto the original text, so lowercasing
+        # must not change the keyword's length
+        if not word or len(word) != len(keyword):
+            return None
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=512)
+def _kw_pattern(keyword):
+    """
+    Compile the whole-word, case-insensitive pattern for a keyword.
+
+    Args:
+        keyword: Keyword to match
+
+    Returns:
+        re.Pattern: Compiled pattern, cached per keyword
+    """
+    return re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
+
+
+def _is_word_char(char):
+    """Return True for characters that regex \\w matches."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text, index):
+    """Return True if a regex \\b would match at index in text."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _iter_keyword_matches(text, keywords):
+    """
+    Find whole-word, case-insensitive occurrences of each keyword.
+
+    Matches are produced keyword by keyword, in the order given, and in
+    position order for each keyword, the same as running
+    re.finditer(r"\\bkeyword\\b", text, re.IGNORECASE) for each keyword in turn.
+
+    Args:
+        text: Text to search in
+        keywords: Keywords to search for
+
+    Yields:
+        tuple: (keyword, start, end) for each match
+    """
+    automaton = _keyword_automaton(tuple(keywords))
+    lowered_text = text.lower()
+    same_length = len(lowered_text) == len(text)
+
+    # Without the automaton, or if lowercasing shifts positions, scan with
+    # one regex per keyword
+    if automaton is None or not same_length:
+        for keyword in keywords:
+            # Most keywords are absent from most pages; a plain substring
+            # test rules them out without running the regex. It is only
+            # trusted when lowercasing maps characters one to one.
+            word = keyword.lower()
+            if same_length and len(word) == len(keyword) and word not in lowered_text:
+                continue
+            for match in _kw_pattern(keyword).finditer(text):
+                yield keyword, match.start(), match.end()
+        return
+
+    # One pass over the text collects the start of every candidate match
+    starts = {}
+    for end_index, word in automaton.iter(lowered_text):
+        starts.setdefault(word, []).append(end_index + 1 - len(word))
+
+    for keyword in keywords:
+        word = keyword.lower()
+        last_end = 0
+        for start in starts.get(word, ()):
+            end = start + len(word)
+            # Like finditer, matches of one keyword never overlap
+            if (
+                start >= last_end
+                and _at_word_boundary(text, start)
+                and _at_word_boundary(text, end)
+            ):
+                last_end = end
+                yield keyword, start, end
 
 
 def extract_context(text, keyword):
@@ -22,24 +178,20 @@ def extract_context(text, keyword):
     Returns:
         str: Context around the keyword
     """
-    # Define regex pattern to split text into sentences
-    sentence_pattern = re.compile(
-        r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<!\d\.)(?<=\.|\?|\!)\s+(?=[A-Z0-9])"
-    )
-
     # Clean the text (remove excessive whitespace and newlines)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
 
     # Split text into sentences
-    sentences = sentence_pattern.split(text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     # Find the sentence containing the keyword
     keyword_sentences = []
     keyword_indices = []
 
+    pattern = _kw_pattern(keyword)
     for i, sentence in enumerate(sentences):
-        if re.search(r"\b" + re.escape(keyword) + r"\b", sentence, re.IGNORECASE):
+        if pattern.search(sentence):
             keyword_sentences.append(sentence)
             keyword_indices.append(i)
 
@@ -62,80 +214,128 @@ def extract_context(text, keyword):
     return context
 
 
-def search_page_for_keywords(driver, url, keywords, content_filter):
+def _split_sentences(text):
     """
-    Search a page for keywords and return the results with deduplication.
+    Split whitespace-normalized text into sentences, keeping their offsets.
 
     Args:
-        driver: Selenium WebDriver instance
+        text: Text with whitespace already collapsed to single spaces
+
+    Returns:
+        tuple: (starts, sentences) where starts[i] is the offset of
+            sentences[i] in text, in ascending order
+    """
+    starts = [0]
+    sentences = []
+    for boundary in _SENTENCE_SPLIT_RE.finditer(text):
+        sentences.append(text[starts[-1] : boundary.start()])
+        starts.append(boundary.end())
+    sentences.append(text[starts[-1] :])
+    return starts, sentences
+
+
+def _context_at(text, starts, sentences, match_start, match_end):
+    """
+    Return the sentence containing a match and its neighbours.
+
+    The context is cut to at most CONTEXT_CHARS characters either side of
+    the match, so text without sentence punctuation does not return the
+    whole page.
+
+    Args:
+        text: Text the sentences were split from
+        starts: Sentence start offsets from _split_sentences
+        sentences: Sentences from _split_sentences
+        match_start: Offset of the start of the match in text
+        match_end: Offset of the end of the match in text
+
+    Returns:
+        str: Previous, current and next sentence, within the bound
+    """
+    index = bisect_right(starts, match_start) - 1
+    first = max(0, index - 1)
+    last = min(len(sentences) - 1, index + 1)
+    begin = max(starts[first], match_start - CONTEXT_CHARS)
+    end = min(starts[last] + len(sentences[last]), match_end + CONTEXT_CHARS)
+    return text[begin:end].strip()
+
+
+def extract_keywords_from_html(page_content, url, keywords, content_filter):
+    """
+    Search page HTML for keywords and return the results with deduplication.
+
+    This does no browser I/O, so it can run on HTML fetched earlier or
+    elsewhere. Errors are raised to the caller.
+
+    Args:
+        page_content: HTML of the page
         url: URL of the page being searched
         keywords: List of keywords to search for
         content_filter: ContentFilter instance
 
     Returns:
-        list: List of [url, keyword, context] entries for found keywords
+        list: List of (url, keyword, context) tuples for found keywords
     """
     results = []
-    seen_entries = set()  # Track unique (url, keyword, context) combinations
+    # (keyword, context) pairs already reported; the url is the same for
+    # every entry, so it is left out of the key
+    seen_entries = set()
 
-    try:
-        # Get the page source after JavaScript execution
-        page_content = driver.page_source
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(page_content, "lxml")
 
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(page_content, "html.parser")
-
-        # Apply content filtering by removing excluded elements
-        excluded_selectors = content_filter.get_excluded_selectors()
-        for selector in excluded_selectors:
-            for element in soup.select(selector):
-                element.decompose()
-
-        # Extract all text elements
-        text_elements = soup.find_all(
-            ["p", "li", "h1", "h2", "h3", "h4", "h5", "h6", "div", "span"]
-        )
-
-        # Filter out empty or very short text elements
-        text_elements = [
-            el
-            for el in text_elements
-            if el.get_text(strip=True) and len(el.get_text(strip=True)) > 1
-        ]
-
-        # Get text content
-        page_text = " ".join(
-            [element.get_text(strip=True) for element in text_elements]
-        )
-
-        # Search for each keyword
-        for keyword in keywords:
-            # Find all occurrences of the keyword
-            pattern = re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
-            for match in pattern.finditer(page_text):
-                # Get context around the keyword
-                start = max(0, match.start() - 300)
-                end = min(len(page_text), match.end() + 300)
+    # Apply content filtering by removing excluded elements
+    content_filter.apply_to_soup(soup)
+
+    # Extract the text of the outermost text elements in one traversal,
+    # so nested text is not repeated, skipping empty or very short blocks
+    texts = []
+    for element in _iter_text_blocks(soup):
+        text = element.get_text(" ", strip=True)
+        if len(text) > 1:
+            texts.append(text)
+
+    # Get text content, with whitespace collapsed once for the whole page
+    page_text = _WHITESPACE_RE.sub(" ", " ".join(texts)).strip()
+
+    # Sentences are split once per page, on the first match
+    sentence_index = None
+
+    # Find all occurrences of every keyword
+    for keyword, match_start, match_end in _iter_keyword_matches(page_text, keywords):
+        if sentence_index is None:
+            sentence_index = _split_sentences(page_text)
 
-                # Extract text chunk around the keyword
-                text_chunk = page_text[start:end]
+        # Get the sentence containing the match and its neighbours
+        context = _context_at(page_text, *sentence_index, match_start, match_end)
 
-                # Extract the sentence context
-                context = extract_context(text_chunk, keyword)
+        # Add to results only if we haven't seen this combination before
+        entry_key = (keyword, context)
+        if entry_key not in seen_entries:
+            seen_entries.add(entry_key)
+            results.append((url, keyword, context))
 
-                # Skip empty contexts or those that don't actually contain the keyword
-                if not context or not pattern.search(context):
-                    continue
+    return results
 
-                # Create an entry tuple for deduplication check
-                entry = (url, keyword, context)
 
-                # Add to results only if we haven't seen this combination before
-                if entry not in seen_entries:
-                    seen_entries.add(entry)
-                    results.append(list(entry))
+def search_page_for_keywords(driver, url, keywords, content_filter):
+    """
+    Search a page for keywords and return the results with deduplication.
+
+    Args:
+        driver: Selenium WebDriver instance
+        url: URL of the page being searched
+        keywords: List of keywords to search for
+        content_filter: ContentFilter instance
+
+    Returns:
+        list: List of (url, keyword, context) tuples for found keywords
+    """
+    try:
+        # Get the page source after JavaScript execution
+        page_content = driver.page_source
 
-        return results
+        return extract_keywords_from_html(page_content, url, keywords, content_filter)
 
     except Exception as e:
         print(f"Error searching for keywords on {url}: {e}")
@@ -40,10 +40,80 @@ class ContentFilter:
         self.include_sidebars = include_sidebars
         self.custom_exclude_selectors = custom_exclude_selectors or []
 
+        # Selector cache, rebuilt whenever the settings above change
+        self._selector_key = None
+        self._excluded_selectors = ()
+        self._combined_selector = ""
+
+    def _settings_key(self):
+        """Return a hashable snapshot of the settings that decide the selectors."""
+        return (
+            self.include_headers,
+            self.include_menus,
+            self.include_footers,
+            self.include_sidebars,
+            tuple(self.custom_exclude_selectors),
+        )
+
+    def _refresh_selectors(self):
+        """Rebuild the cached selectors if the filter settings have changed."""
+        key = self._settings_key()
+        if key != self._selector_key:
+            self._excluded_selectors = tuple(self._build_excluded_selectors())
+            self._combined_selector = ", ".join(self._excluded_selectors)
+            self._selector_key = key
+
     def get_excluded_selectors(self):
         """
         Return CSS selectors for elements that should be excluded.
 
+        The selectors are built once and reused until the filter settings change.
+
+        Returns:
+            tuple: CSS selectors to exclude
+        """
+        self._refresh_selectors()
+        return self._excluded_selectors
+
+    def get_combined_selector(self):
+        """
+        Return all excluded selectors joined into a single CSS selector group.
+
+        Returns:
+            str: Comma-separated selector, or an empty string if nothing is excluded
+        """
+        self._refresh_selectors()
+        return self._combined_selector
+
+    def apply_to_soup(self, soup):
+        """
+        Remove excluded elements from a parsed page.
+
+        All excluded selectors are matched in a single select() call.
+
+        Args:
+            soup: BeautifulSoup object to filter in place
+
+        Returns:
+            int: Number of elements removed
+        """
+        combined_selector = self.get_combined_selector()
+        if not combined_selector:
+            return 0
+
+        removed = 0
+        for element in soup.select(combined_selector):
+            # Elements inside an already removed ancestor are gone too
+            if getattr(element, "decomposed", False):
+                continue
+            element.decompose()
+            removed += 1
+        return removed
+
+    def _build_excluded_selectors(self):
+        """
+        Build the list of CSS selectors for elements that should be excluded.
+
         Returns:
             list: List of CSS selectors to exclude
         """
@@ -9,38 +9,150 @@ and saving Markdown content to files.
 import hashlib
 import os
 import re
+import string
 from urllib.parse import urlparse
 
 import html2text
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString, Tag
 
+# Output directories already created by this process
+_ENSURED_DIRS = set()
 
-def html_to_markdown(html_content, url=""):
+
+class _FilenameTable(dict):
+    """
+    str.translate table for filenames: ASCII letters, digits, "_" and "-" are
+    kept and every other character becomes "_".
     """
-    Convert HTML content to markdown format.
 
-    Args:
-        html_content: HTML content to convert
-        url: URL of the page (for reference)
+    def __missing__(self, codepoint):
+        # Remember the mapping so the next lookup stays in C
+        self[codepoint] = "_"
+        return "_"
+
+
+_FILENAME_TABLE = _FilenameTable(
+    (ord(char), char) for char in string.ascii_letters + string.digits + "_-"
+)
+
+
+def _add_url_header(markdown_content, url):
+    """Add the page URL as a reference at the top of the markdown."""
+    if url:
+        return f"# Page from: {url}\n\n{markdown_content}"
+    return markdown_content
+
+
+def _make_converter():
+    """
+    Create an html2text converter configured for page content.
 
     Returns:
-        str: Markdown formatted content
+        html2text.HTML2Text: Converter instance (not reusable across pages)
     """
-    # Configure html2text
     h = html2text.HTML2Text()
     h.ignore_links = False
     h.ignore_images = False
     h.ignore_tables = False
     h.ignore_emphasis = False
     h.body_width = 0  # Don't wrap lines
+    return h
 
-    # Convert to markdown
-    markdown_content = h.handle(html_content)
+
+# Characters BeautifulSoup escapes as entities when serializing text; the
+# parser reports them through handle_entityref rather than handle_data
+_ESCAPED_TEXT_RE = re.compile(r"([&<>])")
+
+
+def _feed_soup(h, root):
+    """
+    Drive an html2text converter with the parser events for a soup tree.
+
+    The events are the ones HTMLParser would produce for str(root), so the
+    markdown is the same without serializing and re-parsing the page.
+
+    Args:
+        h: html2text.HTML2Text instance
+        root: BeautifulSoup object or Tag to convert
+    """
+    # Each stack entry is a node to visit, or a (tag name,) tuple marking
+    # where that tag closes. The document object itself is not serialized.
+    if isinstance(root, BeautifulSoup):
+        stack = list(reversed(root.contents))
+    else:
+        stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple):
+            h.handle_endtag(node[0])
+        elif isinstance(node, Tag):
+            attrs = [
+                (name, " ".join(value) if isinstance(value, list) else value)
+                for name, value in node.attrs.items()
+            ]
+            h.handle_starttag(node.name, attrs)
+            if node.is_empty_element:
+                # Serialized as <tag/>, which the parser closes immediately
+                h.handle_endtag(node.name)
+            else:
+                stack.append((node.name,))
+                stack.extend(reversed(node.contents))
+        elif isinstance(node, PreformattedString):
+            # Comments, doctypes and the like produce no markdown
+            continue
+        elif type(node) is not NavigableString:
+            # Script and style text is serialized and parsed verbatim
+            h.handle_data(str(node))
+        else:
+            for index, part in enumerate(_ESCAPED_TEXT_RE.split(node)):
+                if index % 2:
+                    h.handle_data(part, True)
+                elif part:
+                    h.handle_data(part)
+
+
+def soup_to_markdown(soup, url=""):
+    """
+    Convert a parsed BeautifulSoup tree to markdown format.
+
+    The tree is walked directly instead of being serialized for html2text to
+    parse again. Only the <body> is converted, since the <head> produces no
+    markdown; the output is the same as html_to_markdown(str(soup), url).
+
+    Args:
+        soup: BeautifulSoup object to convert
+        url: URL of the page (for reference)
+
+    Returns:
+        str: Markdown formatted content
+    """
+    h = _make_converter()
+    _feed_soup(h, soup.body if soup.body is not None else soup)
+    markdown_content = h.optwrap(h.finish())
+    if h.pad_tables:
+        markdown_content = html2text.utils.pad_tables_in_text(markdown_content)
 
     # Add URL as reference at the top
-    if url:
-        markdown_content = f"# Page from: {url}\n\n{markdown_content}"
+    return _add_url_header(markdown_content, url)
 
-    return markdown_content
+
+def html_to_markdown(html_content, url=""):
+    """
+    Convert HTML content to markdown format.
+
+    Args:
+        html_content: HTML content to convert
+        url: URL of the page (for reference)
+
+    Returns:
+        str: Markdown formatted content
+    """
+    # Convert to markdown
+    markdown_content = _make_converter().handle(html_content)
+
+    # Add URL as reference at the top
+    return _add_url_header(markdown_content, url)
 
 
 def save_markdown_file(domain, category, url, markdown_content):
@@ -56,15 +168,12 @@ def save_markdown_file(domain, category, url, markdown_content):
     Returns:
         str: Path to the saved file
     """
-    # Create base directory
+    # Create the base directory and category subdirectory, once per process
     base_dir = f"{domain}_files"
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
-
-    # Create category subdirectory
     category_dir = os.path.join(base_dir, category)
-    if not os.path.exists(category_dir):
-        os.makedirs(category_dir)
+    if category_dir not in _ENSURED_DIRS:
+        os.makedirs(category_dir, exist_ok=True)
+        _ENSURED_DIRS.add(category_dir)
 
     # Create a filename from the URL
     parsed_url = urlparse(url)
@@ -76,11 +185,11 @@ def save_markdown_file(domain, category, url, markdown_content):
     else:
         # Clean up path to create filename
         path = path.rstrip("/")
-        path = re.sub(r"[^a-zA-Z0-9_-]", "_", path)
+        path = path.translate(_FILENAME_TABLE)
 
         # Add query parameters if present (useful for SPAs)
         if parsed_url.query:
-            query_str = re.sub(r"[^a-zA-Z0-9_-]", "_", parsed_url.query)
+            query_str = parsed_url.query.translate(_FILENAME_TABLE)
             path = f"{path}__{query_str}"
 
         filename = f"{path}.md"
@@ -88,14 +197,16 @@ def save_markdown_file(domain, category, url, markdown_content):
         # Ensure filename is not too long
         if len(filename) > 250:
             filename = (
-                filename[:240] + hashlib.md5(filename.encode()).hexdigest()[:10] + ".md"
+                filename[:240]
+                + hashlib.blake2b(filename.encode(), digest_size=5).hexdigest()
+                + ".md"
             )
 
     # Full path to file
     file_path = os.path.join(category_dir, filename)
 
-    # Write content to file
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
+    # Encode once and write the bytes in a single call
+    with open(file_path, "wb") as f:
+        f.write(markdown_content.encode("utf-8"))
 
     return file_path
@@ -7,121 +7,205 @@ including page categorization and structure analysis.
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from .._optional import load_ahocorasick
 
-def determine_page_category(soup, url):
+# Terms whose occurrences in the page text score each content category
+CATEGORY_TERMS = {
+    "products": [
+        "product",
+        "feature",
+        "capability",
+        "buy",
+        "purchase",
+        "pricing",
+        "edition",
+        "license",
+    ],
+    "solutions": [
+        "solution",
+        "service",
+        "approach",
+        "methodology",
+        "framework",
+        "platform",
+        "integrate",
+    ],
+    "documentation": [
+        "documentation",
+        "guide",
+        "reference",
+        "manual",
+        "tutorial",
+        "instruction",
+        "implementation",
+    ],
+    "blog": [
+        "blog",
+        "post",
+        "article",
+        "news",
+        "update",
+        "published",
+        "author",
+        "date",
+    ],
+    "faq": [
+        "faq",
+        "question",
+        "answer",
+        "frequently asked",
+        "common question",
+        "troubleshoot",
+    ],
+    "help": [
+        "help",
+        "support",
+        "contact us",
+        "assistance",
+        "ticket",
+        "troubleshoot",
+    ],
+}
+
+# Every distinct term, in first-seen order
+_ALL_TERMS = tuple(
+    dict.fromkeys(term for terms in CATEGORY_TERMS.values() for term in terms)
+)
+
+
+@lru_cache(maxsize=None)
+def _category_automaton():
     """
-    Attempts to categorize a webpage based on content and URL patterns.
+    Build the Aho-Corasick automaton over all category terms.
+
+    Returns:
+        ahocorasick.Automaton: Shared automaton, or None if pyahocorasick
+            is not installed
+    """
+    ahocorasick = load_ahocorasick()
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in _ALL_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_category_terms(text):
+    """
+    Count the occurrences of every category term in text.
+
+    Counts are the same as text.count(term) for each term, but with
+    pyahocorasick installed all terms are counted in a single pass.
 
     Args:
-        soup: BeautifulSoup object of the page
-        url: URL of the page
+        text: Lowercased page text
 
     Returns:
-        str: Category name (products, solutions, documentation, blog, faq, help, or misc)
+        dict: Term -> number of non-overlapping occurrences
     """
-    path = urlparse(url).path.lower()
+    automaton = _category_automaton()
+    if automaton is None:
+        return {term: text.count(term) for term in _ALL_TERMS}
 
-    # URL-based categorization
-    if any(segment in path for segment in ["/product", "/products"]):
-        return "products"
-    elif any(segment in path for segment in ["/solution", "/solutions"]):
-        return "solutions"
-    elif any(
-        segment in path
-        for segment in [
-            "/doc",
-            "/docs",
-            "/documentation",
-            "/guide",
-            "/guides",
-            "/manual",
-        ]
-    ):
-        return "documentation"
-    elif any(
-        segment in path for segment in ["/blog", "/news", "/article", "/articles"]
-    ):
-        return "blog"
-    elif any(
-        segment in path for segment in ["/faq", "/faqs", "/question", "/questions"]
-    ):
-        return "faq"
-    elif any(segment in path for segment in ["/help", "/support", "/troubleshoot"]):
-        return "help"
+    counts = dict.fromkeys(_ALL_TERMS, 0)
+    last_ends = {}
+    for end_index, term in automaton.iter(text):
+        # Like str.count, occurrences of one term never overlap
+        if end_index + 1 - len(term) >= last_ends.get(term, 0):
+            counts[term] += 1
+            last_ends[term] = end_index + 1
+    return counts
 
-    # Content-based categorization
-    text_content = soup.get_text().lower()
-
-    # Count occurrences of category-related terms
-    category_terms = {
-        "products": [
-            "product",
-            "feature",
-            "capability",
-            "buy",
-            "purchase",
-            "pricing",
-            "edition",
-            "license",
-        ],
-        "solutions": [
-            "solution",
-            "service",
-            "approach",
-            "methodology",
-            "framework",
-            "platform",
-            "integrate",
-        ],
-        "documentation": [
-            "documentation",
-            "guide",
-            "reference",
-            "manual",
-            "tutorial",
-            "instruction",
-            "implementation",
-        ],
-        "blog": [
-            "blog",
-            "post",
-            "article",
-            "news",
-            "update",
-            "published",
-            "author",
-            "date",
-        ],
-        "faq": [
-            "faq",
-            "question",
-            "answer",
-            "frequently asked",
-            "common question",
-            "troubleshoot",
-        ],
-        "help": [
-            "help",
-            "support",
-            "contact us",
-            "assistance",
-            "ticket",
-            "troubleshoot",
-        ],
-    }
-
-    # Count occurrences of category terms
+# URL path prefixes of each category, in priority order. A path belongs to a
+# category when "/" followed by one of its prefixes occurs anywhere in it.
+_PATH_PREFIXES = (
+    ("products", ("product",)),
+    ("solutions", ("solution",)),
+    ("documentation", ("doc", "guide", "manual")),
+    ("blog", ("blog", "news", "article")),
+    ("faq", ("faq", "question")),
+    ("help", ("help", "support", "troubleshoot")),
+)
+
+# Prefix -> (priority, category)
+_PREFIX_CATEGORY = {
+    prefix: (rank, category)
+    for rank, (category, prefixes) in enumerate(_PATH_PREFIXES)
+    for prefix in prefixes
+}
+
+# Every "/<prefix>" occurrence in a path, found in a single scan. Prefixes
+# contain no "/", so successive matches never overlap and none are missed.
+_PATH_PREFIX_RE = re.compile(
+    "/(" + "|".join(re.escape(prefix) for prefix in _PREFIX_CATEGORY) + ")"
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_by_path(path):
+    """
+    Categorize a page from its URL path alone.
+
+    A category matches when "/" followed by one of its prefixes occurs in the
+    path; if several match, the one listed first in _PATH_PREFIXES wins.
+    Results are cached per path, so retries and fragment or query variants of
+    a URL are answered without rescanning.
+
+    Args:
+        path: Lowercased URL path
+
+    Returns:
+        str: Category name, or None if the path names no category
+    """
+    best = None
+    for match in _PATH_PREFIX_RE.finditer(path):
+        candidate = _PREFIX_CATEGORY[match.group(1)]
+        if best is None or candidate < best:
+            best = candidate
+            if best[0] == 0:
+                break
+    return best[1] if best is not None else None
+
+
+def _categorize_by_content(soup):
+    """
+    Categorize a page by scoring category terms in its text and headers.
+
+    Only called when the URL path names no category, so pages categorized by
+    URL never have their text extracted.
+
+    Args:
+        soup: BeautifulSoup object of the page
+
+    Returns:
+        str: Category name, or "misc" if no category scores high enough
+    """
+    # Count occurrences of category terms; the raw text is only needed long
+    # enough to lowercase it
+    term_counts = _count_category_terms(soup.get_text().lower())
     category_scores = {}
-    for category, terms in category_terms.items():
-        score = sum(text_content.count(term) for term in terms)
+    for category, terms in CATEGORY_TERMS.items():
+        score = sum(term_counts[term] for term in terms)
         category_scores[category] = score
 
     # Check for h1/h2 headers that might indicate category
-    headers = [h.get_text().lower() for h in soup.find_all(["h1", "h2"])]
-    for header in headers:
-        for category, terms in category_terms.items():
+    headers = soup.find_all(["h1", "h2"])
+
+    # Each header adds at most 5 to a category. If the body text already
+    # gives one category a significant lead that the headers cannot close,
+    # the result is settled without checking them.
+    ranked = sorted(category_scores.values(), reverse=True)
+    if ranked[0] > 5 and ranked[0] - ranked[1] > 5 * len(headers):
+        return max(category_scores, key=category_scores.get)
+
+    for header in (h.get_text().lower() for h in headers):
+        for category, terms in CATEGORY_TERMS.items():
             if any(term in header for term in terms):
                 category_scores[category] += 5  # Give extra weight to header matches
 
@@ -138,3 +222,25 @@ def determine_page_category(soup, url):
 
     # Default to misc if no strong category detected
     return "misc"
+
+
+def determine_page_category(soup, url):
+    """
+    Attempts to categorize a webpage based on content and URL patterns.
+
+    Args:
+        soup: BeautifulSoup object of the page
+        url: URL of the page
+
+    Returns:
+        str: Category name (products, solutions, documentation, blog, faq, help, or misc)
+    """
+    path = urlparse(url).path.lower()
+
+    # URL-based categorization
+    category = _categorize_by_path(path)
+    if category is not None:
+        return category
+
+    # Content-based categorization
+    return _categorize_by_content(soup)
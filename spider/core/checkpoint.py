@@ -6,11 +6,86 @@ This module contains functionality for saving and loading crawler state,
 enabling resumption of crawling after interruption.
 """
 
+import gzip
 import json
 import os
+import threading
 import time
 
 
+def _dumps(data):
+    """
+    Encode checkpoint data as compact JSON bytes, using orjson when installed.
+
+    Args:
+        data: Dictionary containing crawler state
+
+    Returns:
+        bytes: The encoded checkpoint
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _loads(raw):
+    """
+    Decode checkpoint JSON bytes, using orjson when installed.
+
+    Args:
+        raw: Contents of the checkpoint file
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error
+            type is a subclass of it)
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _shared_prefix_length(a, b):
+    """Return the length of the longest common prefix of two strings."""
+    # Binary search on the length, comparing slices in C rather than
+    # walking the characters in Python
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _front_code(urls):
+    """
+    Front-code sorted URLs for the visited file.
+
+    Args:
+        urls: Sorted visited URLs
+
+    Yields:
+        str: One line per URL: the length of the prefix it shares with the
+            previous URL, a tab, and the rest of the URL
+    """
+    previous = ""
+    for url in urls:
+        # Line breaks are not valid in URLs; stray ones are percent-encoded
+        # so every URL stays on its own line
+        url = url.replace("\r", "%0D").replace("\n", "%0A")
+        prefix_length = _shared_prefix_length(previous, url)
+        yield f"{prefix_length}\t{url[prefix_length:]}\n"
+        previous = url
+
+
 class CheckpointManager:
     """
     Handles saving and loading crawler checkpoints to enable resumable crawling.
@@ -28,20 +103,40 @@ class CheckpointManager:
             auto_save_interval: Seconds between automatic checkpoint saves
         """
         self.checkpoint_file = checkpoint_file
+        # Visited URLs are kept beside the checkpoint, sorted, front-coded and
+        # gzipped, so the largest part of the state is streamed out rather
+        # than encoded as one JSON document
+        self.visited_file = f"{checkpoint_file}.visited.gz"
         self.auto_save_interval = auto_save_interval
         self.last_save_time = 0
         self.last_save_pages = 0
 
+        # Periodic saves are written by a background thread so the crawler
+        # does not wait on fsync. Only the newest unwritten save is kept.
+        self._pending_save = None
+        self._pending_condition = threading.Condition()
+        self._writer_thread = None
+
+        # Held while checkpoint files are written; sequence numbers keep an
+        # older save from overwriting a newer one already on disk
+        self._write_lock = threading.Lock()
+        self._save_sequence = 0
+        self._written_sequence = 0
+
     def save_checkpoint(self, data, force=False):
         """
         Save crawler state to checkpoint file.
 
+        Forced saves are written before this returns. Other saves are handed
+        to a background writer, which reports its own errors.
+
         Args:
             data: Dictionary containing crawler state
             force: Whether to force a save regardless of interval
 
         Returns:
-            bool: True if checkpoint was saved, False otherwise
+            bool: True if the checkpoint was written (forced) or accepted for
+                writing (not forced), False otherwise
         """
         current_time = time.time()
         pages_visited = data.get("pages_visited", 0)
@@ -57,39 +152,108 @@ class CheckpointManager:
             data["checkpoint_time"] = current_time
             data["checkpoint_version"] = "1.0"
 
-            # Use atomic write to prevent corruption
-            tmp_file = f"{self.checkpoint_file}.tmp"
-            with open(tmp_file, "w") as f:
-                json.dump(data, f)
-
-                # Ensure data is written to disk
-                f.flush()
-                os.fsync(f.fileno())
+            # Encode the state now, so later changes to it by the crawler
+            # cannot leak into the saved checkpoint
+            state = dict(data)
+            visited = state.pop("visited", None)
+            if visited is not None:
+                state["visited_file"] = os.path.basename(self.visited_file)
+            encoded = _dumps(state)
+        except Exception as e:
+            print(f"Critical error saving checkpoint: {e}")
+            return False
+
+        with self._pending_condition:
+            self._save_sequence += 1
+            save = (self._save_sequence, data, visited, encoded)
+            if force:
+                # A forced save supersedes any save still waiting to be written
+                self._pending_save = None
+            else:
+                self._pending_save = save
+                self._start_writer()
+                self._pending_condition.notify()
+
+        # Forced saves (shutdown, end of crawl) are written before returning
+        if force and not self._write_checkpoint(save):
+            return False
+
+        # Update last save info
+        self.last_save_time = current_time
+        self.last_save_pages = pages_visited
+
+        return True
+
+    def _start_writer(self):
+        """Start the background checkpoint writer if it is not running."""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Write periodic checkpoints handed over by save_checkpoint."""
+        while True:
+            with self._pending_condition:
+                while self._pending_save is None:
+                    self._pending_condition.wait()
+                save = self._pending_save
+                self._pending_save = None
+
+            self._write_checkpoint(save)
+
+    def _write_checkpoint(self, save):
+        """
+        Write one checkpoint to disk.
 
-            # Rename for atomic replace
-            os.replace(tmp_file, self.checkpoint_file)
+        Args:
+            save: (sequence, data, visited, encoded) tuple from save_checkpoint
 
-            # Update last save info
-            self.last_save_time = current_time
-            self.last_save_pages = pages_visited
+        Returns:
+            bool: True if the checkpoint was written, False otherwise
+        """
+        sequence, data, visited, encoded = save
 
-            return True
+        with self._write_lock:
+            # A newer checkpoint is already on disk
+            if sequence <= self._written_sequence:
+                return True
 
-        except Exception as e:
-            # Try direct write if atomic operation failed
             try:
-                print(f"Error with atomic checkpoint save: {e}")
-                with open(self.checkpoint_file, "w") as f:
-                    json.dump(data, f)
+                # Write the visited URLs first, so the checkpoint never refers
+                # to an older visited file than the one it was saved with
+                if visited is not None:
+                    self._write_visited(visited)
+
+                # Use atomic write to prevent corruption
+                tmp_file = f"{self.checkpoint_file}.tmp"
+                with open(tmp_file, "wb") as f:
+                    f.write(encoded)
+
+                    # Ensure data is written to disk
+                    f.flush()
+                    os.fsync(f.fileno())
 
-                # Update last save info
-                self.last_save_time = current_time
-                self.last_save_pages = pages_visited
+                # Rename for atomic replace
+                os.replace(tmp_file, self.checkpoint_file)
 
+                self._written_sequence = sequence
                 return True
-            except Exception as e2:
-                print(f"Critical error saving checkpoint: {e2}")
-                return False
+
+            except Exception as e:
+                # Try direct write if atomic operation failed, keeping the
+                # visited URLs inline
+                try:
+                    print(f"Error with atomic checkpoint save: {e}")
+                    with open(self.checkpoint_file, "wb") as f:
+                        f.write(_dumps(data))
+
+                    self._written_sequence = sequence
+                    return True
+                except Exception as e2:
+                    print(f"Critical error saving checkpoint: {e2}")
+                    return False
 
     def load_checkpoint(self):
         """
@@ -102,8 +266,18 @@ class CheckpointManager:
             return None
 
         try:
-            with open(self.checkpoint_file, "r") as f:
-                checkpoint_data = json.load(f)
+            # Wait for any checkpoint being written in the background
+            with self._write_lock:
+                with open(self.checkpoint_file, "rb") as f:
+                    raw = f.read()
+            checkpoint_data = _loads(raw)
+
+            # Checkpoints written with a visited file keep the URLs there
+            visited_file = checkpoint_data.pop("visited_file", None)
+            if visited_file is not None and "visited" not in checkpoint_data:
+                checkpoint_data["visited"] = self._read_visited(
+                    os.path.join(os.path.dirname(self.checkpoint_file), visited_file)
+                )
 
             # Check data validity
             if "checkpoint_time" not in checkpoint_data:
@@ -131,6 +305,54 @@ class CheckpointManager:
             print(f"Error loading checkpoint: {e}")
             return None
 
+    def _write_visited(self, urls):
+        """
+        Atomically write visited URLs to the visited file.
+
+        URLs are sorted and front-coded: each line holds the length of the
+        prefix shared with the previous URL, a tab, and the rest of the URL.
+        Crawled URLs share long prefixes, so this and gzip keep the file small.
+
+        Args:
+            urls: Iterable of visited URLs
+        """
+        tmp_file = f"{self.visited_file}.tmp"
+        with open(tmp_file, "wb") as raw:
+            with gzip.open(
+                raw, "wt", encoding="utf-8", newline="\n", compresslevel=6
+            ) as f:
+                f.writelines(_front_code(sorted(urls)))
+
+            # Ensure data is written to disk
+            raw.flush()
+            os.fsync(raw.fileno())
+
+        os.replace(tmp_file, self.visited_file)
+
+    def _read_visited(self, path):
+        """
+        Read visited URLs written by _write_visited.
+
+        Args:
+            path: Path to the visited file
+
+        Returns:
+            list: Visited URLs
+        """
+        if not path.endswith(".gz"):
+            # Plain file with one URL per line
+            with open(path, "r", encoding="utf-8", newline="\n") as f:
+                return [line[:-1] for line in f if line != "\n"]
+
+        urls = []
+        previous = ""
+        with gzip.open(path, "rt", encoding="utf-8", newline="\n") as f:
+            for line in f:
+                prefix_length, _, suffix = line[:-1].partition("\t")
+                previous = previous[: int(prefix_length)] + suffix
+                urls.append(previous)
+        return urls
+
     def should_save_checkpoint(self, pages_visited):
         """
         Determine if it's time to save a checkpoint based on time or progress.
@@ -11,12 +11,14 @@ import os
 import signal
 import threading
 import time
-from multiprocessing import Lock, Manager, Queue, Value
+from collections import deque
+from multiprocessing import Lock, Queue, Value
 from queue import Empty
 from urllib.parse import urlparse
 
 from ..content.filter import ContentFilter
 from ..workers.manager import WorkerPool
+from ..workers.worker import remove_stale_profiles
 from .checkpoint import CheckpointManager
 from .rate_controller import CrawlRateController
 
@@ -89,33 +91,37 @@ class Spider:
         # Create a default content filter if none provided
         self.content_filter = content_filter or ContentFilter()
 
-        # Create a multiprocessing manager
-        self.manager = Manager()
-
-        # Set up URL tracking
-        self.visited = self.manager.list()
-        self.to_visit = self.manager.list([(self.start_url, 0)])  # (url, depth)
-        self.pending_urls = self.manager.list()
-        self.retry_queue = (
-            self.manager.Queue()
-        )  # Queue for URLs that need to be retried
-        self.url_cache = self.manager.dict()  # Deduplication cache
+        # Set up URL tracking. Only threads of this process use these, so
+        # they are plain containers rather than Manager proxies, which would
+        # cost an IPC round trip per operation.
+        self.visited = set()
+        self.to_visit = deque([(self.start_url, 0)])  # (url, depth)
+        # URLs in to_visit, for constant-time membership checks. The result,
+        # retry and requeue threads all change to_visit, so both containers
+        # are only updated together under _to_visit_lock.
+        self._to_visit_set = {self.start_url}
+        self._to_visit_lock = threading.Lock()
+        # URLs handed to workers, url -> depth; dicts keep insertion order,
+        # so this doubles as the ordered pending list with O(1) removal
+        self.pending_urls = {}
+        self.retry_queue = Queue()  # Queue for URLs that need to be retried
+        self.url_cache = set()  # Deduplication cache
 
         # Add start URL to cache
-        self.url_cache[self.start_url] = 0  # Store depth with URL (0 for seed URL)
+        self.url_cache.add(self.start_url)
 
         # Add deduplication tracking for results
-        self.seen_results = self.manager.dict()
+        self.seen_results = set()
 
         # Create shared counters with locks
         self.pages_visited = Value("i", 0)
         self.pages_visited_lock = Lock()
 
         # For markdown mode, track statistics by category
-        self.markdown_stats = self.manager.dict()
+        self.markdown_stats = {}
 
         # Track retry counts for URLs
-        self.retry_counts = self.manager.dict()
+        self.retry_counts = {}
         self.max_retries = 3
 
         # Create rate controller
@@ -211,11 +217,11 @@ class Spider:
             print(f"Warning: No URLs to process. Starting URL is: {self.start_url}")
             # Ensure the start URL is in the to_visit list
             if (
-                self.start_url not in self.to_visit
+                self.start_url not in self._to_visit_set
                 and self.start_url not in self.visited
             ):
                 print(f"Adding start URL {self.start_url} to queue")
-                self.to_visit.append(self.start_url)
+                self._queue_url(self.start_url)
 
         # Initialize task queue with URLs from to_visit
         self._fill_task_queue()
@@ -226,7 +232,7 @@ class Spider:
             initial_workers=self.target_workers.value,
             task_queue=self.task_queue,
             result_queue=self.result_queue,
-            url_cache=self.url_cache,
+            retry_queue=self.retry_queue,
             base_domain=self.base_domain,
             path_prefix=self.path_prefix,
             keywords=self.keywords,
@@ -291,17 +297,19 @@ class Spider:
 
         try:
             # Restore visited URLs
-            self.visited[:] = checkpoint_data.get("visited", [])
+            self.visited.clear()
+            self.visited.update(checkpoint_data.get("visited", []))
 
             # Restore URLs to visit (including pending ones for safety)
             pending_from_checkpoint = checkpoint_data.get("pending_urls", [])
             
-            # Handle both old-style (url string only) and new-style (url, depth) formats
+            # Handle both old-style (url string only) and new-style (url, depth)
+            # formats; JSON brings (url, depth) pairs back as lists
             to_visit_list = []
             for item in checkpoint_data.get("to_visit", []):
-                if isinstance(item, tuple) and len(item) == 2:
+                if isinstance(item, (list, tuple)) and len(item) == 2:
                     # This is already in the new (url, depth) format
-                    to_visit_list.append(item)
+                    to_visit_list.append(tuple(item))
                 else:
                     # This is in the old format (url string only), add depth 0
                     to_visit_list.append((item, 0))
@@ -309,35 +317,32 @@ class Spider:
             # Do the same for pending URLs
             pending_list = []
             for item in pending_from_checkpoint:
-                if isinstance(item, tuple) and len(item) == 2:
-                    pending_list.append(item)
+                if isinstance(item, (list, tuple)) and len(item) == 2:
+                    pending_list.append(tuple(item))
                 else:
                     pending_list.append((item, 0))
                     
             # Update the to_visit list
-            self.to_visit[:] = pending_list + to_visit_list
+            with self._to_visit_lock:
+                self.to_visit.clear()
+                self._to_visit_set = set()
+                for url, depth in pending_list + to_visit_list:
+                    # Keep one entry per URL, as _queue_url does
+                    if url not in self._to_visit_set:
+                        self._to_visit_set.add(url)
+                        self.to_visit.append((url, depth))
 
             # Start with empty pending list
-            self.pending_urls[:] = []
+            self.pending_urls.clear()
 
             # Restore visited pages counter
             with self.pages_visited_lock:
                 self.pages_visited.value = checkpoint_data.get("pages_visited", 0)
 
-            # Restore URL cache - ensure it uses strings as keys, not tuples or lists
+            # Restore URL cache from the visited URLs and the URLs to visit
             self.url_cache.clear()  # Clear existing cache
-            
-            # Add visited URLs to cache (with depth 0 if not specified)
-            for url in self.visited:
-                self.url_cache[url] = 0
-                
-            # Add URLs to visit to cache with their depth
-            for url_info in self.to_visit:
-                if isinstance(url_info, tuple) and len(url_info) == 2:
-                    url, depth = url_info
-                    self.url_cache[url] = depth
-                else:
-                    self.url_cache[url_info] = 0
+            self.url_cache.update(self.visited)
+            self.url_cache.update(self._to_visit_set)
 
             # Restore rate controller state if available
             if "rate_controller" in checkpoint_data:
@@ -365,8 +370,7 @@ class Spider:
                     next(reader)  # Skip header
                     for row in reader:
                         if len(row) >= 3:
-                            key = (row[0], row[1], row[2])
-                            self.seen_results[str(key)] = True
+                            self.seen_results.add((row[0], row[1], row[2]))
 
             print(
                 f"Resumed from checkpoint: {len(self.visited)} visited URLs, {len(self.to_visit)} URLs to visit"
@@ -382,6 +386,27 @@ class Spider:
             return False
 
 
+    def _queue_url(self, url_info):
+        """
+        Append a URL to the to_visit queue unless it is already queued.
+
+        Keeping one entry per URL lets _fill_task_queue drop a URL from
+        _to_visit_set as soon as it is taken off the queue.
+
+        Args:
+            url_info: (url, depth) tuple, or a bare URL for depth 0
+
+        Returns:
+            bool: True if the URL was added, False if it was already queued
+        """
+        url = url_info[0] if isinstance(url_info, tuple) else url_info
+        with self._to_visit_lock:
+            if url in self._to_visit_set:
+                return False
+            self.to_visit.append(url_info)
+            self._to_visit_set.add(url)
+        return True
+
     def _fill_task_queue(self):
         """
         Fill the task queue with URLs from to_visit.
@@ -396,21 +421,23 @@ class Spider:
         added = 0
         for _ in range(min(urls_to_add, len(self.to_visit))):
             if len(self.to_visit) > 0:
-                url_info = self.to_visit.pop(0)
-                
-                # Handle both tuple format (url, depth) and string format for backward compatibility
-                if isinstance(url_info, tuple) and len(url_info) == 2:
-                    url, depth = url_info
-                else:
-                    url = url_info
-                    depth = 0  # Default to depth 0 for old format
+                with self._to_visit_lock:
+                    url_info = self.to_visit.popleft()
+
+                    # Handle both tuple format (url, depth) and string format for backward compatibility
+                    if isinstance(url_info, tuple) and len(url_info) == 2:
+                        url, depth = url_info
+                    else:
+                        url = url_info
+                        depth = 0  # Default to depth 0 for old format
+                    self._to_visit_set.discard(url)
                     
                 # Skip if already visited
                 if url in self.visited:
                     continue
 
                 # Add to pending list
-                self.pending_urls.append((url, depth))
+                self.pending_urls[url] = depth
 
                 # Add to task queue - workers need both URL and depth
                 self.task_queue.put((url, depth))
@@ -489,9 +516,8 @@ class Spider:
         current_depth = result.get("depth", 0)  # Get current depth, default to 0
 
         # Mark as visited
-        if url in self.pending_urls:
-            self.pending_urls.remove(url)
-        self.visited.append(url)
+        self.pending_urls.pop(url, None)
+        self.visited.add(url)
 
         if self.markdown_mode and "markdown_saved" in result:
             # Handle markdown mode result
@@ -512,9 +538,9 @@ class Spider:
 
             if keyword_results:
                 for row in keyword_results:
-                    key = str((row[0], row[1], row[2]))
+                    key = (row[0], row[1], row[2])
                     if key not in self.seen_results:
-                        self.seen_results[key] = True
+                        self.seen_results.add(key)
                         unique_results.append(row)
 
                 if unique_results:
@@ -540,8 +566,8 @@ class Spider:
         if self.max_depth is None or next_depth <= self.max_depth:
             for link in new_links:
                 if link not in self.url_cache:
-                    self.to_visit.append((link, next_depth))
-                    self.url_cache[link] = next_depth
+                    self._queue_url((link, next_depth))
+                    self.url_cache.add(link)
                     links_added += 1
 
             if links_added > 0:
@@ -592,13 +618,11 @@ class Spider:
         )
 
         # Remove from pending list
-        if url in self.pending_urls:
-            self.pending_urls.remove(url)
+        self.pending_urls.pop(url, None)
 
         # Only mark as visited if we're not retrying
         if handling.get("action") not in ["retry", "retry_once", "throttle_and_retry"]:
-            if url not in self.visited:
-                self.visited.append(url)
+            self.visited.add(url)
 
         # Handle rate limiting specifically
         if handling.get("action") == "throttle_and_retry":
@@ -635,12 +659,10 @@ class Spider:
         print(f"Skipped {url}: {reason}")
 
         # Remove from pending list
-        if url in self.pending_urls:
-            self.pending_urls.remove(url)
+        self.pending_urls.pop(url, None)
 
         # Mark as visited to avoid retrying
-        if url not in self.visited:
-            self.visited.append(url)
+        self.visited.add(url)
 
         # Update activity timestamp
         self.last_activity_time = time.time()
@@ -658,8 +680,7 @@ class Spider:
         print(f"Error processing {url}: {error}")
 
         # Remove from pending list
-        if url in self.pending_urls:
-            self.pending_urls.remove(url)
+        self.pending_urls.pop(url, None)
 
         # We don't mark as visited since it might be retried
 
@@ -689,6 +710,9 @@ class Spider:
                 retry_after = retry_item.get("retry_after", 0)
                 action = retry_item.get("action", "retry")
 
+                # The worker has given up on this URL, so it is no longer pending
+                self.pending_urls.pop(url, None)
+
                 # Check if URL has been retried too many times
                 url_str = str(url)
                 current_retries = self.retry_counts.get(url_str, 0)
@@ -696,8 +720,7 @@ class Spider:
                 if current_retries >= self.max_retries:
                     print(f"Dropping {url} after {current_retries} retries")
                     # Mark as visited to avoid further attempts
-                    if url not in self.visited:
-                        self.visited.append(url)
+                    self.visited.add(url)
                     continue
 
                 # Increment retry counter
@@ -706,8 +729,7 @@ class Spider:
                 # If action is 'retry_once' and already retried, skip it
                 if action == "retry_once" and current_retries > 0:
                     print(f"Dropping {url} after single retry attempt")
-                    if url not in self.visited:
-                        self.visited.append(url)
+                    self.visited.add(url)
                     continue
 
                 # Schedule the retry
@@ -740,7 +762,7 @@ class Spider:
                 else:
                     # Immediate retry - make sure it's not already in process
                     if url not in self.visited and url not in self.pending_urls:
-                        self.to_visit.append(url)
+                        self._queue_url(url)
 
                 # Update activity timestamp
                 self.last_activity_time = time.time()
@@ -793,13 +815,13 @@ class Spider:
                 # Check if we should still requeue this URL
                 url_in_visited = url in self.visited
                 url_in_pending = url in self.pending_urls
-                url_in_to_visit = url in self.to_visit
+                url_in_to_visit = url in self._to_visit_set
 
                 if not url_in_visited and not url_in_pending and not url_in_to_visit:
                     print(
                         f"Requeuing {url} (attempt {current_status.get('attempt', '?')})"
                     )
-                    self.to_visit.append(url)
+                    self._queue_url(url)
 
                     # Update activity timestamp
                     self.last_activity_time = time.time()
@@ -815,9 +837,9 @@ class Spider:
             if (
                 url not in self.visited
                 and url not in self.pending_urls
-                and url not in self.to_visit
+                and url not in self._to_visit_set
             ):
-                self.to_visit.append(url)
+                self._queue_url(url)
 
                 # Update activity timestamp
                 self.last_activity_time = time.time()
@@ -834,8 +856,9 @@ class Spider:
         """
         try:
             # Convert to_visit and pending_urls to serializable format if needed
+            # Iterate over snapshots, since other threads append while this runs
             to_visit_serializable = []
-            for item in self.to_visit:
+            for item in list(self.to_visit):
                 if isinstance(item, tuple) and len(item) == 2:
                     # Already in (url, depth) format
                     to_visit_serializable.append(item)
@@ -843,14 +866,7 @@ class Spider:
                     # Convert to (url, 0) format
                     to_visit_serializable.append((item, 0))
                     
-            pending_urls_serializable = []
-            for item in self.pending_urls:
-                if isinstance(item, tuple) and len(item) == 2:
-                    # Already in (url, depth) format
-                    pending_urls_serializable.append(item)
-                else:
-                    # Convert to (url, 0) format
-                    pending_urls_serializable.append((item, 0))
+            pending_urls_serializable = list(self.pending_urls.items())
 
             # Prepare checkpoint data
             checkpoint_data = {
@@ -871,9 +887,7 @@ class Spider:
 
             # Add markdown stats if in markdown mode
             if self.markdown_mode:
-                checkpoint_data["markdown_stats"] = {
-                    k: v for k, v in self.markdown_stats.items()
-                }
+                checkpoint_data["markdown_stats"] = dict(self.markdown_stats)
 
             # Save checkpoint
             saved = self.checkpoint_manager.save_checkpoint(
@@ -881,8 +895,10 @@ class Spider:
             )
 
             if saved:
+                # Only forced saves are on disk by now; others are written by
+                # the checkpoint manager's background writer
                 print(
-                    f"Checkpoint saved: {self.pages_visited.value} pages visited, {len(self.to_visit)} URLs to visit"
+                    f"Checkpoint {'saved' if force else 'queued'}: {self.pages_visited.value} pages visited, {len(self.to_visit)} URLs to visit"
                 )
 
             return saved
@@ -916,7 +932,9 @@ class Spider:
         """
         last_progress_check = time.time()
         last_urls_count = len(self.to_visit) + len(self.pending_urls)
-        worker_status = {}  # Track worker status
+        # Workers whose last status report showed recent activity. Updated
+        # only when a worker reports in, so the completion check is O(1).
+        busy_workers = set()
         
         while not self.stop_event.is_set() or not self.result_queue.empty():
             try:
@@ -935,18 +953,8 @@ class Spider:
                         if current_time - self.last_activity_time > 3:
                             print("Crawling appears complete - checking worker status...")
                             
-                            # Check if all workers are idle
-                            active_count = 0
-                            idle_count = 0
-                            
-                            for worker_id, status in worker_status.items():
-                                if status.get("active", False):
-                                    active_count += 1
-                                    if status.get("idle_time", 0) > 5:  # Worker idle for 5+ seconds
-                                        idle_count += 1
-                            
                             # If all active workers are idle, or no active workers
-                            if active_count == 0 or active_count == idle_count:
+                            if not busy_workers:
                                 print("All workers idle or finished. Shutting down...")
                                 self.stop_event.set()
                                 break
@@ -958,26 +966,23 @@ class Spider:
                     if result["status"] == "worker_status":
                         # Update worker status tracking
                         worker_id = result.get("worker_id")
-                        worker_status[worker_id] = {
-                            "active": True,
-                            "idle_time": result.get("idle_time", 0),
-                            "last_update": time.time()
-                        }
+                        if result.get("idle_time", 0) > 5:  # Worker idle for 5+ seconds
+                            busy_workers.discard(worker_id)
+                        else:
+                            busy_workers.add(worker_id)
                         continue
                         
                     elif result["status"] == "worker_shutdown":
                         # Worker is shutting down
                         worker_id = result.get("worker_id")
                         print(f"Worker {worker_id} is shutting down: {result.get('reason')}")
-                        if worker_id in worker_status:
-                            worker_status[worker_id]["active"] = False
+                        busy_workers.discard(worker_id)
                         continue
                         
                     elif result["status"] == "worker_shutdown_complete":
                         # Worker has completed shutdown
                         worker_id = result.get("worker_id")
-                        if worker_id in worker_status:
-                            del worker_status[worker_id]
+                        busy_workers.discard(worker_id)
                         continue
                 
                 # Register response with rate controller for adaptive control
@@ -1136,6 +1141,9 @@ class Spider:
         # Stop worker pool with a shorter timeout
         if self.worker_pool:
             self.worker_pool.stop(timeout=2)
+
+        # Drop browser profiles beyond the worker limit that no browser holds
+        remove_stale_profiles(self.base_domain, self.rate_controller.max_workers)
         
         # Wait for threads with timeout
         for thread in [self.result_thread, self.retry_thread, self.checkpoint_thread]:
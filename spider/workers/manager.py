@@ -8,6 +8,7 @@ coordination of multiple crawler worker processes.
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Lock, Queue, Value
 
 from .worker import Worker
@@ -27,7 +28,6 @@ class WorkerPool:
         initial_workers,
         task_queue,
         result_queue,
-        url_cache,
         base_domain,
         path_prefix,
         keywords,
@@ -43,6 +43,7 @@ class WorkerPool:
         use_undetected=False,
         browser_engine="selenium",
         browser_type="chromium",
+        retry_queue=None,
     ):
         """
         Initialize the worker pool.
@@ -51,7 +52,6 @@ class WorkerPool:
             initial_workers: Initial number of workers to start
             task_queue: Queue for distributing URLs to workers
             result_queue: Queue for collecting results from workers
-            url_cache: Shared dictionary for tracking visited URLs
             base_domain: Base domain for crawling
             path_prefix: Path prefix to restrict crawling
             keywords: List of keywords to search for
@@ -64,13 +64,14 @@ class WorkerPool:
             allowed_extensions: Additional file extensions to allow
             is_spa: Whether to use SPA-specific processing
             markdown_mode: Whether to save content as markdown
+            retry_queue: Queue workers put URLs on for retrying; a new
+                queue is created if not given
         """
         """Initialize the worker pool."""
         self.spider = spider
         self.initial_workers = initial_workers
         self.task_queue = task_queue
         self.result_queue = result_queue
-        self.url_cache = url_cache
         self.base_domain = base_domain
         self.path_prefix = path_prefix
         self.keywords = keywords
@@ -87,13 +88,14 @@ class WorkerPool:
         self.browser_engine = browser_engine
         self.browser_type = browser_type
 
-        # Set up worker tracking
-        self.workers = []
+        # Set up worker tracking; dicts keep insertion order, so this doubles
+        # as the ordered worker list while allowing O(1) removal by ID
         self.worker_processes = {}
         self.next_worker_id = 0
 
         # Create shared resources for worker coordination
-        self.retry_queue = Queue()  # Queue for URLs that need to be retried
+        # Queue for URLs that need to be retried
+        self.retry_queue = retry_queue if retry_queue is not None else Queue()
         self.active_workers = Value("i", 0)
         self.active_workers_lock = Lock()
 
@@ -106,6 +108,21 @@ class WorkerPool:
         self.is_running = False
         self.stop_event = threading.Event()
 
+    @property
+    def workers(self):
+        """List of tracked workers, oldest first."""
+        return list(self.worker_processes.values())
+
+    def _forget_workers(self, workers):
+        """
+        Stop tracking the given workers.
+
+        Args:
+            workers: Iterable of Worker instances to drop
+        """
+        for worker in workers:
+            self.worker_processes.pop(worker.worker_id, None)
+
     def start(self):
         """Start the worker pool with the initial number of workers."""
         self.is_running = True
@@ -142,7 +159,6 @@ class WorkerPool:
             worker_id=worker_id,
             task_queue=self.task_queue,
             result_queue=self.result_queue,
-            url_cache=self.url_cache,
             base_domain=self.base_domain,
             path_prefix=self.path_prefix,
             keywords=self.keywords,
@@ -167,7 +183,6 @@ class WorkerPool:
         process = worker.start()
 
         # Track the worker
-        self.workers.append(worker)
         self.worker_processes[worker_id] = worker
 
         print(f"Started worker {worker_id} with delay={self.current_delay.value:.2f}s using {self.browser_engine} engine")
@@ -198,13 +213,13 @@ class WorkerPool:
             # Create a list of workers to terminate (last 'excess' workers)
             workers_to_terminate = alive_workers[-excess:]
 
-            # Terminate these workers
+            # Terminate these workers concurrently
             for worker in workers_to_terminate:
                 print(f"Terminating worker {worker.worker_id}")
-                worker.stop()
+            self._stop_workers(workers_to_terminate, timeout=5)
 
-            # Update the workers list
-            self.workers = [w for w in self.workers if w.is_alive()]
+            # Drop the stopped workers by ID
+            self._forget_workers(w for w in workers_to_terminate if not w.is_alive())
 
         # If we need more workers, start new ones
         elif current_count < target:
@@ -221,19 +236,17 @@ class WorkerPool:
         while not self.stop_event.is_set() and self.spider.is_running:
             try:
                 # Check for completed or dead workers
-                alive_workers = [w for w in self.workers if w.is_alive()]
+                workers = self.workers
+                alive_workers = [w for w in workers if w.is_alive()]
 
                 # If some workers died unexpectedly, remove them from our list
-                if len(alive_workers) != len(self.workers):
+                if len(alive_workers) != len(workers):
                     # Only treat as unexpected death if we're not in controlled shutdown
                     if not self.spider.controlled_shutdown:
                         print(
-                            f"Some workers died unexpectedly. Alive: {len(alive_workers)}/{len(self.workers)}"
+                            f"Some workers died unexpectedly. Alive: {len(alive_workers)}/{len(workers)}"
                         )
-                        self.workers = alive_workers
-                    else:
-                        # In controlled shutdown, just update the list
-                        self.workers = alive_workers
+                    self._forget_workers(w for w in workers if not w.is_alive())
 
                 # Check if we need to adjust worker count based on rate controller
                 target = self.target_workers.value
@@ -318,19 +331,35 @@ class WorkerPool:
                 break
             time.sleep(0.1)
             
-        # For any remaining workers, stop them individually
-        for worker in self.workers:
-            if worker.is_alive():
-                worker.stop(timeout=max(0.5, timeout/2))
-
-        # Clear worker lists
-        self.workers = []
+        # Snapshot and clear worker lists before the blocking joins
+        workers_to_stop = [w for w in self.workers if w.is_alive()]
         self.worker_processes = {}
 
+        # Stop any remaining workers in parallel
+        self._stop_workers(workers_to_stop, timeout=max(0.5, timeout / 2))
+
         # Wait for monitor thread to finish (reduced timeout)
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=1.0)
 
+    def _stop_workers(self, workers, timeout):
+        """
+        Join (and if needed terminate) several workers at once.
+
+        Each join can block for up to ``timeout`` seconds, so running them
+        concurrently bounds the sweep by the slowest worker rather than the
+        sum of all of them.
+
+        Args:
+            workers: Workers to stop
+            timeout: Per-worker join timeout in seconds
+        """
+        if not workers:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            list(executor.map(lambda w: w.stop(timeout=timeout), workers))
+
     def _monitor_workers(self):
         """
         Monitor worker processes and adjust as needed.
@@ -343,13 +372,13 @@ class WorkerPool:
         shutdown_initiated_time = None
         
         # Continue monitoring even if spider.is_running is false
-        while not self.stop_event.is_set() and (self.spider.is_running or len(self.workers) > 0):
+        while not self.stop_event.is_set() and (self.spider.is_running or self.worker_processes):
             try:
                 # Check for completed or dead workers
                 alive_workers = [w for w in self.workers if w.is_alive()]
 
                 # If all workers are gone, track when this happened
-                if len(alive_workers) == 0 and len(self.workers) > 0:
+                if len(alive_workers) == 0 and self.worker_processes:
                     if zero_workers_time is None:
                         zero_workers_time = time.time()
                         print(f"All workers have exited at {time.strftime('%H:%M:%S')}")
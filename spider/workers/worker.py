@@ -6,8 +6,11 @@ This module contains the Worker class and worker_process function that handle
 individual crawling tasks.
 """
 
+import os
 import signal
 import sys
+import tempfile
+import threading
 import time
 from multiprocessing import Process
 from queue import Empty
@@ -16,14 +19,190 @@ from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
 # Import the browser factory
-from ..browser import create_browser, wait_for_spa_content, extract_links, execute_browser_script, clean_cookie_elements
+from ..browser import create_browser, wait_for_spa_content, extract_links, execute_browser_script, clean_cookie_elements, install_cookie_cleaner
 from ..content.extractor import search_page_for_keywords
-from ..content.markdown import html_to_markdown, save_markdown_file
+from ..content.markdown import save_markdown_file, soup_to_markdown
 from ..content.parser import determine_page_category
 from ..utils.http import handle_response_code
 from ..utils.url import is_webpage_url
 
 
+def _profile_path(base_domain, slot):
+    """Return the Chrome profile directory for a site and slot number."""
+    return os.path.join(
+        tempfile.gettempdir(),
+        f"spider-profile-{base_domain.replace(':', '_')}-{slot}",
+    )
+
+
+def claim_profile_dir(base_domain):
+    """
+    Claim the lowest-numbered Chrome profile slot for a site not in use.
+
+    Each slot is guarded by an OS file lock held until the calling process
+    exits, so concurrent workers and concurrent crawls never share a profile,
+    and the slot of a worker that died frees up by itself. The number of
+    slots stays bounded by the peak number of browsers running at once.
+
+    Args:
+        base_domain: Domain being crawled
+
+    Returns:
+        tuple: (profile directory, open lock file), or (None, None) where
+            file locking is unavailable and the browser should use a
+            throwaway profile
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return None, None
+
+    slot = 0
+    while True:
+        path = _profile_path(base_domain, slot)
+        lock_file = open(path + ".lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            slot += 1
+            continue
+        return path, lock_file
+
+
+def remove_stale_profiles(base_domain, keep):
+    """
+    Delete a site's unused Chrome profiles numbered keep and above.
+
+    Slots below keep are left for the next crawl to reuse; higher slots only
+    appear when crawls overlap or a browser fails to quit, and are removed
+    once no process holds their lock.
+
+    Args:
+        base_domain: Domain that was crawled
+        keep: Number of low-numbered slots to keep
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return
+
+    import shutil
+
+    prefix = os.path.basename(_profile_path(base_domain, ""))
+    temp_dir = tempfile.gettempdir()
+    try:
+        names = os.listdir(temp_dir)
+    except OSError:
+        return
+
+    for name in names:
+        slot = name[len(prefix):]
+        if not name.startswith(prefix) or not slot.isdigit() or int(slot) < keep:
+            continue
+        path = os.path.join(temp_dir, name)
+        try:
+            with open(path + ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                shutil.rmtree(path, ignore_errors=True)
+                os.remove(path + ".lock")
+        except OSError:
+            # Still in use, or already gone
+            pass
+
+
+class BrowserPrewarmer:
+    """
+    Launches a browser on a background thread so that Chrome's start-up
+    latency overlaps with waiting for work instead of delaying a URL.
+
+    Only used for the selenium engine: Playwright's sync API objects are
+    bound to the thread that created them.
+    """
+
+    def __init__(self, launch):
+        """
+        Initialize the prewarmer.
+
+        Args:
+            launch: Zero-argument callable that creates and returns a browser
+        """
+        self._launch = launch
+        self._thread = None
+        self._browser = None
+        self._error = None
+        # Set by discard(); a launch that finishes afterwards quits its own
+        # browser. _lock guards the hand-off between the two.
+        self._discarded = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Begin launching a browser unless one is already on its way."""
+        if self._thread is None:
+            # Not a daemon: a worker exiting mid-launch waits for the launch
+            # to finish so the discarded browser is quit, not orphaned
+            self._thread = threading.Thread(target=self._run)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            browser = self._launch()
+        except Exception as e:
+            self._error = e
+            return
+
+        with self._lock:
+            if not self._discarded:
+                self._browser = browser
+                return
+        try:
+            browser.quit()
+        except Exception:
+            pass
+
+    def take(self):
+        """
+        Wait for the pending launch and hand over the browser.
+
+        Returns:
+            The launched browser instance
+
+        Raises:
+            Exception: Whatever the launch raised
+        """
+        self.start()
+        self._thread.join()
+        browser, error = self._browser, self._error
+        self._thread = self._browser = self._error = None
+        if error is not None:
+            raise error
+        return browser
+
+    def discard(self, timeout=5):
+        """
+        Quit a browser that was launched but never taken.
+
+        A launch still running after the timeout quits its browser itself
+        when it finishes. The prewarmer must not be used afterwards.
+
+        Args:
+            timeout: Seconds to wait for an in-flight launch to finish
+        """
+        if self._thread is None:
+            return
+        with self._lock:
+            self._discarded = True
+        self._thread.join(timeout=timeout)
+        with self._lock:
+            browser = self._browser
+        if browser is not None:
+            try:
+                browser.quit()
+            except Exception:
+                pass
+        self._thread = self._browser = self._error = None
+
+
 class Worker:
     """
     Worker class that represents a crawler worker responsible for
@@ -35,7 +214,6 @@ class Worker:
         worker_id,
         task_queue,
         result_queue,
-        url_cache,
         base_domain,
         path_prefix,
         keywords,
@@ -62,7 +240,6 @@ class Worker:
             worker_id: Unique ID for this worker
             task_queue: Queue for receiving URLs to process
             result_queue: Queue for sending back results
-            url_cache: Shared dict of processed URLs
             base_domain: Base domain to crawl
             path_prefix: Path prefix to restrict crawling
             keywords: List of keywords to search for
@@ -83,7 +260,6 @@ class Worker:
         self.worker_id = worker_id
         self.task_queue = task_queue
         self.result_queue = result_queue
-        self.url_cache = url_cache
         self.base_domain = base_domain
         self.path_prefix = path_prefix
         self.keywords = keywords
@@ -117,7 +293,6 @@ class Worker:
                 self.worker_id,
                 self.task_queue,
                 self.result_queue,
-                self.url_cache,
                 self.base_domain,
                 self.path_prefix,
                 self.keywords,
@@ -163,7 +338,6 @@ def worker_process(
     worker_id,
     task_queue,
     result_queue,
-    url_cache,
     base_domain,
     path_prefix,
     keywords,
@@ -192,7 +366,6 @@ def worker_process(
         worker_id: ID for this worker
         task_queue: Queue for receiving URLs to process
         result_queue: Queue for sending back results
-        url_cache: Shared dict of processed URLs
         base_domain: Base domain to crawl
         path_prefix: Path prefix to restrict crawling
         keywords: List of keywords to search for
@@ -280,6 +453,38 @@ def worker_process(
     # Set up browser for this worker (delayed initialization)
     browser = None
     restarts = 0
+
+    # Give each worker slot its own persistent profile so browser restarts
+    # (and later crawls of the same site) reuse the HTTP cache. The slot
+    # locks are held until this process exits.
+    profile_dir = None
+    profile_locks = []
+    if browser_engine == "selenium":
+        profile_dir, lock_file = claim_profile_dir(base_domain)
+        if lock_file is not None:
+            profile_locks.append(lock_file)
+
+    def launch_browser():
+        # Use the factory to create a browser instance with the specified engine
+        new_browser = create_browser(
+            engine=browser_engine,
+            headless=headless,
+            webdriver_path=webdriver_path,
+            page_load_timeout=30 if browser_engine == "selenium" else 30000,
+            retry_count=3,
+            type=browser_type,
+            user_data_dir=profile_dir,
+        )
+        # Have the browser strip cookie banners itself as pages load
+        install_cookie_cleaner(new_browser)
+        return new_browser
+
+    # Launch the first browser while we wait for a URL, and later launch
+    # replacements in the background after a crash
+    prewarmer = None
+    if browser_engine == "selenium":
+        prewarmer = BrowserPrewarmer(launch_browser)
+        prewarmer.start()
     
     # Status reporting to main process
     last_status_report = time.time()
@@ -380,19 +585,16 @@ def worker_process(
                 # Initialize browser if not already done
                 if browser is None:
                     try:
-                        print(
-                            f"Worker {worker_id} initializing {browser_engine} browser for first URL"
-                        )
-                        
-                        # Use the factory to create a browser instance with the specified engine
-                        browser = create_browser(
-                            engine=browser_engine,
-                            headless=headless,
-                            webdriver_path=webdriver_path,
-                            page_load_timeout=30 if browser_engine == "selenium" else 30000,
-                            retry_count=3,
-                            type=browser_type,
-                        )
+                        if prewarmer is not None:
+                            print(
+                                f"Worker {worker_id} using pre-launched {browser_engine} browser"
+                            )
+                            browser = prewarmer.take()
+                        else:
+                            print(
+                                f"Worker {worker_id} initializing {browser_engine} browser for first URL"
+                            )
+                            browser = launch_browser()
                         
                     except Exception as e:
                         print(f"Worker {worker_id} failed to initialize browser: {e}")
@@ -584,19 +786,16 @@ def worker_process(
                         page_content = browser.page_source
 
                         # Parse with BeautifulSoup
-                        soup = BeautifulSoup(page_content, "html.parser")
+                        soup = BeautifulSoup(page_content, "lxml")
 
                         # Apply content filtering by removing excluded elements
-                        excluded_selectors = content_filter.get_excluded_selectors()
-                        for selector in excluded_selectors:
-                            for element in soup.select(selector):
-                                element.decompose()
+                        content_filter.apply_to_soup(soup)
 
                         # Determine page category
                         category = determine_page_category(soup, url)
 
                         # Convert to markdown
-                        markdown_content = html_to_markdown(str(soup), url)
+                        markdown_content = soup_to_markdown(soup, url)
 
                         # Domain name for directory structure
                         domain = urlparse(url).netloc.replace(".", "_")
@@ -656,13 +855,22 @@ def worker_process(
                     if browser_error:
                         print(f"Worker {worker_id} browser session error: {e}")
 
-                        # Close the current browser
+                        # Close the current browser; quit() often raises on a
+                        # dead session, so the reference is dropped regardless
+                        quit_failed = False
                         try:
                             if browser:
                                 browser.quit()
-                                browser = None
                         except:
-                            pass
+                            quit_failed = True
+                        browser = None
+
+                        # A browser that did not quit may still hold its
+                        # profile, so restart on a fresh slot and keep the old
+                        # one locked
+                        if quit_failed and profile_locks:
+                            profile_dir, lock_file = claim_profile_dir(base_domain)
+                            profile_locks.append(lock_file)
 
                         # Increment restart counter
                         restarts += 1
@@ -686,18 +894,15 @@ def worker_process(
                                 )
                             break
 
-                        # Set up a new browser
+                        # Set up a new browser; with a prewarmer it boots in the
+                        # background and is picked up by the next URL
                         print(
                             f"Worker {worker_id} restarting browser (attempt {restarts}/{max_restarts})..."
                         )
-                        browser = create_browser(
-                            engine=browser_engine,
-                            headless=headless,
-                            webdriver_path=webdriver_path,
-                            page_load_timeout=30 if browser_engine == "selenium" else 30000,
-                            retry_count=3,
-                            type=browser_type
-                        )
+                        if prewarmer is not None:
+                            prewarmer.start()
+                        else:
+                            browser = launch_browser()
 
                         # Put the URL back in the queue
                         if retry_queue is not None:
@@ -739,6 +944,8 @@ def worker_process(
                 browser.quit()
         except:
             pass
+        if prewarmer is not None:
+            prewarmer.discard()
 
         # Decrement active workers counter
         if active_workers_lock and active_workers: